@@ -373,6 +373,41 @@ class SmartTemplates:
         self.env.globals["debug_mode"] = debug
 
 
+# Static spans of the fallback error pages, joined around the dynamic fields
+_DEBUG_HEAD = """
+            <!DOCTYPE html>
+            <html>
+            <head><title>Template Error</title></head>
+            <body>
+                <h1>Template Rendering Error</h1>
+                <p><strong>Type:</strong> """
+_DEBUG_MID_1 = """</p>
+                <p><strong>Message:</strong> """
+_DEBUG_MID_2 = """</p>
+                <p><strong>Template:</strong> """
+_DEBUG_MID_3 = """</p>
+                """
+_DEBUG_MID_4 = """
+                <pre style="background: #f5f5f5; padding: 10px; overflow-x: auto;">
+"""
+_DEBUG_TAIL = """
+                </pre>
+            </body>
+            </html>
+            """
+_SERVER_ERROR_HEAD = """
+            <!DOCTYPE html>
+            <html>
+            <head><title>Server Error</title></head>
+            <body>
+                <h1>Server Error</h1>
+                <p>"""
+_SERVER_ERROR_TAIL = """</p>
+            </body>
+            </html>
+            """
+
+
 # FastAPI-specific subclass
 class SmartFastApiTemplates(SmartTemplates):
     """
@@ -413,33 +448,37 @@ class SmartFastApiTemplates(SmartTemplates):
     ) -> str:
         """Create a basic HTML error page when template rendering fails"""
         if self.debug_mode and error:
-            return f"""
-            <!DOCTYPE html>
-            <html>
-            <head><title>Template Error</title></head>
-            <body>
-                <h1>Template Rendering Error</h1>
-                <p><strong>Type:</strong> {error.error.error_type}</p>
-                <p><strong>Message:</strong> {error.error.message}</p>
-                <p><strong>Template:</strong> {error.error.template_name or 'Unknown'}</p>
-                {f'<p><strong>Macro:</strong> {error.error.macro_name}</p>' if error.error.macro_name else ''}
-                <pre style="background: #f5f5f5; padding: 10px; overflow-x: auto;">
-{chr(10).join(error.error.stack_trace or [])}
-                </pre>
-            </body>
-            </html>
-            """
+            detail = error.error
+            macro_line = (
+                f"<p><strong>Macro:</strong> {detail.macro_name}</p>"
+                if detail.macro_name
+                else ""
+            )
+            return "".join(
+                (
+                    _DEBUG_HEAD,
+                    detail.error_type,
+                    _DEBUG_MID_1,
+                    detail.message,
+                    _DEBUG_MID_2,
+                    detail.template_name or "Unknown",
+                    _DEBUG_MID_3,
+                    macro_line,
+                    _DEBUG_MID_4,
+                    "\n".join(detail.stack_trace or []),
+                    _DEBUG_TAIL,
+                )
+            )
         else:
-            return f"""
-            <!DOCTYPE html>
-            <html>
-            <head><title>Server Error</title></head>
-            <body>
-                <h1>Server Error</h1>
-                <p>{message if self.debug_mode else 'An error occurred while processing your request.'}</p>
-            </body>
-            </html>
-            """
+            return "".join(
+                (
+                    _SERVER_ERROR_HEAD,
+                    message
+                    if self.debug_mode
+                    else "An error occurred while processing your request.",
+                    _SERVER_ERROR_TAIL,
+                )
+            )
 
 
 def create_smart_response(templates_instance: SmartFastApiTemplates):
@@ -449,7 +488,7 @@ def create_smart_response(templates_instance: SmartFastApiTemplates):
         """Decorator that automatically renders templates for HTML requests and returns JSON for API requests."""
 
         def decorator(func):
-            @wraps(func)
+            @wraps(func, updated=())
             async def wrapper(request, *args, **kwargs):
                 try:
                     # Execute the original function
@@ -468,10 +507,13 @@ def create_smart_response(templates_instance: SmartFastApiTemplates):
 
                     if wants_json:
                         # Import here to avoid circular imports
-                        from fastapi.responses import JSONResponse
+                        from fastapi.responses import JSONResponse, Response
 
                         if isinstance(data, BaseModel):
-                            return JSONResponse(content=data.model_dump())
+                            return Response(
+                                content=data.model_dump_json(),
+                                media_type="application/json",
+                            )
                         else:
                             return JSONResponse(content=data)
 
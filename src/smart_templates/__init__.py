@@ -95,18 +95,30 @@ def __getattr__(name: str) -> object:
                 "pip install smart-templates[testing]"
             ) from e
 
+    elif name == "get_pytest_templates":
+        try:
+            from .pytest_integration import get_pytest_templates
+
+            return get_pytest_templates
+        except ImportError as e:
+            raise ImportError(
+                "get_pytest_templates requires pytest. Install with: "
+                "pip install smart-templates[testing]"
+            ) from e
+
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 # For IDEs and static analysis - these will be available when dependencies are installed
 if False:  # TYPE_CHECKING equivalent without typing import
     from .fastapi_integration import SmartFastApiTemplates, create_smart_response
-    from .pytest_integration import SmartPytestTemplates
+    from .pytest_integration import SmartPytestTemplates, get_pytest_templates
 
     __all__.extend(
         [
             "SmartFastApiTemplates",
             "create_smart_response",
             "SmartPytestTemplates",
+            "get_pytest_templates",
         ]
     )
@@ -12,6 +12,7 @@ from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
 from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, Protocol, Union
 
@@ -105,6 +106,9 @@ class SmartTemplateRegistry:
             config: Registration configuration specifying type and target
         """
         key = self._make_key(obj_type, config.model_class, config.variation)
+        # Re-registering an identical config (e.g. route setup run again) is a no-op
+        if self._registrations.get(key) == config:
+            return
         self._registrations[key] = config
         
         # Clear cache when registrations change
@@ -346,9 +350,16 @@ class SmartTemplates:
         registry: SmartTemplateRegistry | None = None,
         *,
         debug_mode: bool = False,
+        environment: Environment | None = None,
         **kwargs: Any,
     ) -> None:
-        """Initialize the template engine."""
+        """
+        Initialize the template engine.
+
+        Passing an existing Jinja2 environment shares its loader and compiled
+        template cache with other engines; Jinja2 options in kwargs are then
+        ignored, and the environment's owner keeps its loader and globals.
+        """
         # Validate template directory
         template_path = Path(directory)
         if not template_path.exists():
@@ -356,19 +367,23 @@ class SmartTemplates:
         if not template_path.is_dir():
             raise ValueError(f"Template path '{directory}' is not a directory")
 
-        # Create Jinja2 environment
-        loader = FileSystemLoader(directory)
-        self.env = Environment(loader=loader, **kwargs)
+        # Create Jinja2 environment unless sharing one
+        self._owns_env = environment is None
+        if environment is None:
+            environment = Environment(loader=FileSystemLoader(directory), **kwargs)
+        self.env = environment
         self.registry = registry or SmartTemplateRegistry()
         self.debug_mode = debug_mode
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
-        # Add debugging helpers to template globals
-        self.env.globals.update({
-            "debug_var": self._debug_variable,
-            "safe_get": self._safe_get,
-            "debug_mode": self.debug_mode,
-        })
+        # Add debugging helpers to template globals; a shared environment
+        # keeps the helpers bound to its owner
+        if self._owns_env:
+            self.env.globals.update({
+                "debug_var": self._debug_variable,
+                "safe_get": self._safe_get,
+                "debug_mode": self.debug_mode,
+            })
 
     def _debug_variable(self, var: Any, var_name: str = "unknown") -> Any:
         """Helper function available in templates for debugging variables."""
@@ -390,9 +405,17 @@ class SmartTemplates:
         except (KeyError, AttributeError, TypeError, IndexError):
             return default
 
-    def _extract_context_types(self, context: dict[str, Any]) -> dict[str, str]:
-        """Extract type information from context for debugging."""
-        return {
+    def _extract_context_types(
+        self, context: dict[str, Any], max_keys: int | None = None
+    ) -> dict[str, str]:
+        """
+        Extract type information from context for debugging.
+
+        When max_keys is set, only the first max_keys public keys are described
+        and a "<truncated>" entry records the total key count.
+        """
+        items = ((k, v) for k, v in context.items() if not k.startswith("_"))
+        types = {
             key: (
                 f"{type(value).__name__}"
                 + (
@@ -403,9 +426,12 @@ class SmartTemplates:
                     else ""
                 )
             )
-            for key, value in context.items()
-            if not key.startswith("_")
+            for key, value in islice(items, max_keys)
         }
+        # Only flag truncation if a public key was actually left undescribed
+        if max_keys is not None and next(items, None) is not None:
+            types["<truncated>"] = f"{len(context)} keys"
+        return types
 
     def render_safe(
         self, template_name: str, context: dict[str, Any]
@@ -594,7 +620,8 @@ class SmartTemplates:
     def set_debug_mode(self, debug: bool = True) -> None:
         """Enable or disable debug mode for enhanced error reporting."""
         self.debug_mode = debug
-        self.env.globals["debug_mode"] = debug
+        if self._owns_env:
+            self.env.globals["debug_mode"] = debug
 
     def __repr__(self) -> str:
         template_dir = self.env.loader.searchpath[0] if self.env.loader.searchpath else "unknown"
@@ -73,10 +73,10 @@ class SmartDatabaseTemplates(SmartTemplates):
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
             filepath.write_text(content, encoding="utf-8")
-            self._logger.info(f"Generated database file: {filepath}")
+            self._logger.info("Generated database file: %s", filepath)
             return True
         except Exception as e:
-            self._logger.error(f"Failed to write file {filepath}: {e}")
+            self._logger.error("Failed to write file %s: %s", filepath, e)
             return False
 
     def _extract_sqlmodel_table_info(self, model_class: type) -> dict[str, Any]:
@@ -113,7 +113,7 @@ class SmartDatabaseTemplates(SmartTemplates):
             return table_info
             
         except Exception as e:
-            self._logger.error(f"Failed to extract SQLModel info from {model_class}: {e}")
+            self._logger.error("Failed to extract SQLModel info from %s: %s", model_class, e)
             return {"error": str(e), "class_name": model_class.__name__}
 
     def _map_python_to_sqlite_type(self, python_type: str) -> str:
@@ -172,9 +172,9 @@ class SmartDatabaseTemplates(SmartTemplates):
                     if "error" not in table_info:
                         tables.append(table_info)
                     else:
-                        self._logger.warning(f"Skipping {model_class}: {table_info['error']}")
+                        self._logger.warning("Skipping %s: %s", model_class, table_info["error"])
                 else:
-                    self._logger.warning(f"Skipping non-SQLModel class: {model_class}")
+                    self._logger.warning("Skipping non-SQLModel class: %s", model_class)
             
             base_context = {
                 "tables": tables,
@@ -189,14 +189,14 @@ class SmartDatabaseTemplates(SmartTemplates):
 
             if error:
                 self._logger.error(
-                    f"Failed to render schema template: {error.error.message}"
+                    "Failed to render schema template: %s", error.error.message
                 )
                 return "", error
 
             if output_file:
                 output_path = self.output_dir / output_file
                 if self._write_output_file(content, output_path):
-                    self._logger.info(f"Schema written to: {output_path}")
+                    self._logger.info("Schema written to: %s", output_path)
 
             return content, None
 
@@ -242,7 +242,7 @@ class SmartDatabaseTemplates(SmartTemplates):
             tables_data = {}
             for instance in model_instances:
                 if not isinstance(instance, SQLModel):
-                    self._logger.warning(f"Skipping non-SQLModel instance: {type(instance)}")
+                    self._logger.warning("Skipping non-SQLModel instance: %s", type(instance))
                     continue
                 
                 model_class = type(instance)
@@ -278,14 +278,14 @@ class SmartDatabaseTemplates(SmartTemplates):
 
             if error:
                 self._logger.error(
-                    f"Failed to render insert template: {error.error.message}"
+                    "Failed to render insert template: %s", error.error.message
                 )
                 return "", error
 
             if output_file:
                 output_path = self.output_dir / output_file
                 if self._write_output_file(content, output_path):
-                    self._logger.info(f"Insert statements written to: {output_path}")
+                    self._logger.info("Insert statements written to: %s", output_path)
 
             return content, None
 
@@ -352,9 +352,9 @@ class SmartDatabaseTemplates(SmartTemplates):
                         
                         tables.append(table_info)
                     else:
-                        self._logger.warning(f"Skipping {model_class}: {table_info['error']}")
+                        self._logger.warning("Skipping %s: %s", model_class, table_info["error"])
                 else:
-                    self._logger.warning(f"Skipping non-SQLModel class: {model_class}")
+                    self._logger.warning("Skipping non-SQLModel class: %s", model_class)
             
             base_context = {
                 "tables": tables,
@@ -370,14 +370,14 @@ class SmartDatabaseTemplates(SmartTemplates):
 
             if error:
                 self._logger.error(
-                    f"Failed to render select template: {error.error.message}"
+                    "Failed to render select template: %s", error.error.message
                 )
                 return "", error
 
             if output_file:
                 output_path = self.output_dir / output_file
                 if self._write_output_file(content, output_path):
-                    self._logger.info(f"Select statements written to: {output_path}")
+                    self._logger.info("Select statements written to: %s", output_path)
 
             return content, None
 
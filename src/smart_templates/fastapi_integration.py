@@ -4,26 +4,110 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import traceback
 import warnings
 from collections.abc import Callable
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any
 
 from jinja2 import FileSystemLoader
+from markupsafe import escape
 from pydantic import BaseModel
 
-from .core import RenderError, RegistrationConfig, RegistrationType, SmartTemplateRegistry, SmartTemplates
+from .core import (
+    RegistrationConfig,
+    RegistrationType,
+    RenderError,
+    SmartTemplateRegistry,
+    SmartTemplates,
+    TemplateErrorDetail,
+)
 
 try:
     from fastapi import Request
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, Response
 except ImportError as e:
     raise ImportError(
         "FastAPI dependencies not installed. Install with: pip install smart-templates[fastapi]"
     ) from e
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Bundled fallback templates; the location is fixed for the life of the process
+_CORE_TEMPLATES_DIR = Path(__file__).parent / "templates" / "fastapi"
+_CORE_TEMPLATES_DIR_STR = str(_CORE_TEMPLATES_DIR)
+_CORE_TEMPLATES_EXISTS = _CORE_TEMPLATES_DIR.exists()
+
+
+# Last-resort error pages, filled in with HTML-escaped fields
+_DEBUG_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Template Error</title></head>
+<body>
+    <h1>Template Rendering Error</h1>
+    <p><strong>Type:</strong> {error_type}</p>
+    <p><strong>Message:</strong> {message}</p>
+    <p><strong>Template:</strong> {template_name}</p>
+    {macro_line}
+    <pre style="background: #f5f5f5; padding: 10px; overflow-x: auto;">
+{stack_trace}
+    </pre>
+</body>
+</html>
+"""
+_DEBUG_MACRO_LINE = "<p><strong>Macro:</strong> {macro_name}</p>"
+_SERVER_ERROR_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Server Error</title></head>
+<body>
+    <h1>Server Error</h1>
+    <p>{message}</p>
+</body>
+</html>
+"""
+
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """
+    Build a JSON response for plain (non-BaseModel) route data.
+
+    Uses orjson when installed and falls back to the stdlib-backed JSONResponse.
+    Routes that need a custom encoder should return their own Response.
+    """
+    if ORJSON_AVAILABLE:
+        return Response(
+            content=orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS),
+            status_code=status_code,
+            media_type="application/json",
+        )
+    return JSONResponse(content=content, status_code=status_code)
+
+
+_JSON_MEDIA_RANGES = ("application/json", "application/*")
+
+
+@lru_cache(maxsize=256)
+def _accept_wants_json(accept_header: str) -> bool:
+    """
+    Scan an Accept header once for a JSON media range.
+
+    A bare ``*/*`` only counts when it is the sole media range, so browser
+    headers that end in ``*/*;q=0.8`` still negotiate HTML. Results are cached
+    per distinct header value.
+    """
+    parts = accept_header.lower().split(",")
+    for part in parts:
+        if part.split(";", 1)[0].strip() in _JSON_MEDIA_RANGES:
+            return True
+    return len(parts) == 1 and parts[0].split(";", 1)[0].strip() == "*/*"
+
 
 class SmartFastApiTemplates(SmartTemplates):
     """
@@ -67,13 +151,17 @@ class SmartFastApiTemplates(SmartTemplates):
 
     def _register_core_templates(self) -> None:
         """Register core error handling templates."""
-        # Add core templates directory to loader search path
-        core_templates_dir = Path(__file__).parent / "templates" / "fastapi"
-        
-        if core_templates_dir.exists():
-            # Prepend core templates to search path for fallback
-            current_paths = self.env.loader.searchpath
-            self.env.loader = FileSystemLoader([str(core_templates_dir)] + current_paths)
+        # Add core templates directory to loader search path, unless a shared
+        # environment already carries it
+        current_paths = self.env.loader.searchpath
+        if _CORE_TEMPLATES_EXISTS and _CORE_TEMPLATES_DIR_STR not in current_paths:
+            # Prepend core templates to search path for fallback; in a shared
+            # environment append them, so the owner's templates keep priority
+            self.env.loader = FileSystemLoader(
+                [_CORE_TEMPLATES_DIR_STR] + current_paths
+                if self._owns_env
+                else current_paths + [_CORE_TEMPLATES_DIR_STR]
+            )
         
         # Register error handling templates
         error_config = RegistrationConfig(
@@ -106,6 +194,7 @@ class SmartFastApiTemplates(SmartTemplates):
 
         # CRITICAL: Always copy, never mutate input
         if isinstance(data, BaseModel):
+            # to_template_dict/model_dump already return a fresh dict
             if hasattr(data, "to_template_dict"):
                 template_context = data.to_template_dict()
             else:
@@ -120,6 +209,42 @@ class SmartFastApiTemplates(SmartTemplates):
         
         return template_context
 
+    def create_fallback_error_html(
+        self, error: RenderError | None, message: str = "An error occurred"
+    ) -> str:
+        """
+        Build a minimal HTML error page without going through Jinja.
+
+        Used as the last resort when the error template itself cannot be rendered.
+        All dynamic values are HTML-escaped.
+
+        Args:
+            error: Structured error to describe (shown only in debug mode)
+            message: Message to show when no structured error is available
+
+        Returns:
+            Complete HTML document
+        """
+        if self.debug_mode and error:
+            detail = error.error
+            return _DEBUG_PAGE.format(
+                error_type=escape(detail.error_type),
+                message=escape(detail.message),
+                template_name=escape(detail.template_name or "Unknown"),
+                macro_line=(
+                    _DEBUG_MACRO_LINE.format(macro_name=escape(detail.macro_name))
+                    if detail.macro_name
+                    else ""
+                ),
+                stack_trace=escape("\n".join(detail.stack_trace or [])),
+            )
+
+        return _SERVER_ERROR_PAGE.format(
+            message=escape(message)
+            if self.debug_mode
+            else "An error occurred while processing your request."
+        )
+
     def wants_json_response(self, request: Request) -> bool:
         """
         Determine if the request expects a JSON response based on headers and URL.
@@ -130,14 +255,8 @@ class SmartFastApiTemplates(SmartTemplates):
         Returns:
             True if JSON response is expected, False for HTML
         """
-        accept_header = request.headers.get("accept", "text/html").lower()
-
         # Check Accept header for JSON preference
-        wants_json = (
-            "application/json" in accept_header
-            or "application/*" in accept_header
-            or accept_header == "*/*"
-        )
+        wants_json = _accept_wants_json(request.headers.get("accept", "text/html"))
 
         # Check if URL indicates API endpoint
         is_api_path = request.url.path.startswith(self.api_path_prefix)
@@ -190,30 +309,40 @@ def create_smart_response(templates_instance: SmartFastApiTemplates) -> Callable
         """
 
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
+            # Resolve per-route invariants once at decoration time so the
+            # request path uses fast local lookups
+            is_coroutine = asyncio.iscoroutinefunction(func)
+            wants_json = templates_instance.wants_json_response
+            prepare = templates_instance.prepare_context
+            render_safe = templates_instance.render_safe
+            render_obj = templates_instance.render_obj
+
+            @wraps(func, updated=())
             async def wrapper(
                 request: Request, *args: Any, **kwargs: Any
-            ) -> JSONResponse | HTMLResponse:
+            ) -> Response:
                 try:
                     # Execute the original function
-                    if asyncio.iscoroutinefunction(func):
+                    if is_coroutine:
                         data = await func(request, *args, **kwargs)
                     else:
                         data = func(request, *args, **kwargs)
 
                     # Determine response type based on request characteristics
-                    if templates_instance.wants_json_response(request):
-                        # Return JSON response
+                    if wants_json(request):
+                        # Return JSON response (pydantic serializes models directly)
                         if isinstance(data, BaseModel):
-                            return JSONResponse(content=data.model_dump())
+                            return Response(
+                                content=data.model_dump_json(),
+                                media_type="application/json",
+                            )
                         else:
-                            return JSONResponse(content=data)
+                            return _json_response(data)
 
                     else:
-                        # Prepare template context (defensive copy)
-                        template_context = templates_instance.prepare_context(data)
-                        # CRITICAL: Make another copy before adding request to avoid mutation
-                        render_context = template_context.copy()
+                        # prepare_context returns a fresh dict, so the request can be
+                        # added without touching data the route may share or cache
+                        render_context = prepare(data)
                         render_context["request"] = request
 
                         # Determine which template to use
@@ -222,14 +351,10 @@ def create_smart_response(templates_instance: SmartFastApiTemplates) -> Callable
                         
                         if template_name:
                             # Use explicit template
-                            content, render_error = templates_instance.render_safe(
-                                template_name, render_context
-                            )
+                            content, render_error = render_safe(template_name, render_context)
                         else:
                             # Use registry-based resolution (includes auto-generation if enabled)
-                            content, render_error = templates_instance.render_obj(
-                                data, render_context
-                            )
+                            content, render_error = render_obj(data, render_context)
 
                         if render_error:
                             # Pass render error directly to error template
@@ -241,17 +366,18 @@ def create_smart_response(templates_instance: SmartFastApiTemplates) -> Callable
                                 "original_context_keys": list(render_context.keys())
                             }
 
-                            error_content, error_render_error = (
-                                templates_instance.render_safe(error_template, error_context)
+                            error_content, error_render_error = render_safe(
+                                error_template, error_context
                             )
 
                             if error_render_error:
                                 # Last resort: render error as RenderError object
-                                fallback_content, _ = templates_instance.render_obj(
+                                fallback_content, _ = render_obj(
                                     render_error, {"request": request}
                                 )
                                 return HTMLResponse(
-                                    content=fallback_content or "Template rendering failed",
+                                    content=fallback_content
+                                    or templates_instance.create_fallback_error_html(render_error),
                                     status_code=500
                                 )
 
@@ -264,15 +390,24 @@ def create_smart_response(templates_instance: SmartFastApiTemplates) -> Callable
                         "Unhandled exception in smart_response for %s", template_name or "registry-resolved"
                     )
 
-                    # Create structured error using our BaseModel system
-                    import traceback
-                    from .core import TemplateErrorDetail
-                    
+                    # Production JSON clients only get a generic 500, so skip
+                    # building the pydantic error models entirely
+                    debug_mode = templates_instance.debug_mode
+                    if not debug_mode and wants_json(request):
+                        return _json_response(
+                            {"error": "Internal Server Error"}, status_code=500
+                        )
+
+                    # Create structured error using our BaseModel system; only
+                    # format the traceback when debug output can show it
+                    stack_trace = (
+                        traceback.format_exc().splitlines() if debug_mode else None
+                    )
                     error_detail = TemplateErrorDetail(
                         error_type=type(e).__name__,
                         message=str(e),
                         template_name=template_name or "registry-resolved",
-                        stack_trace=traceback.format_exc().splitlines()
+                        stack_trace=stack_trace
                     )
                     structured_error = RenderError(
                         error=error_detail,
@@ -283,14 +418,19 @@ def create_smart_response(templates_instance: SmartFastApiTemplates) -> Callable
                     )
 
                     # Return appropriate error response based on content negotiation
-                    if templates_instance.wants_json_response(request):
-                        return JSONResponse(status_code=500, content=structured_error.model_dump())
-                    else:
-                        error_html, _ = templates_instance.render_obj(
-                            structured_error, {"request": request}
+                    if wants_json(request):
+                        return Response(
+                            content=structured_error.model_dump_json(),
+                            status_code=500,
+                            media_type="application/json",
                         )
+                    else:
+                        error_html, _ = render_obj(structured_error, {"request": request})
                         return HTMLResponse(
-                            content=error_html or f"<h1>Error: {e}</h1>", 
+                            content=error_html
+                            or templates_instance.create_fallback_error_html(
+                                structured_error, str(e)
+                            ),
                             status_code=500
                         )
 
@@ -304,7 +444,15 @@ def create_smart_response(templates_instance: SmartFastApiTemplates) -> Callable
 # FastAPI-native patterns for advanced integration
 class SmartTemplateConfig:
     """Configuration for SmartTemplates FastAPI integration."""
-    
+
+    __slots__ = (
+        "template_dir",
+        "debug_mode",
+        "api_prefix",
+        "default_error_template",
+        "auto_reload",
+    )
+
     def __init__(
         self,
         template_dir: str,
@@ -333,18 +481,15 @@ def create_smart_templates_dependency(config: SmartTemplateConfig) -> Callable:
         async def get_user(user_id: int, templates: SmartFastApiTemplates = Depends(get_templates)):
             # Use templates instance
     """
-    templates_instance = None
-    
+
+    @lru_cache(maxsize=1)
     def get_templates() -> SmartFastApiTemplates:
-        nonlocal templates_instance
-        if templates_instance is None:
-            templates_instance = SmartFastApiTemplates(
-                config.template_dir,
-                debug_mode=config.debug_mode,
-                api_path_prefix=config.api_prefix,
-                auto_reload=config.auto_reload
-            )
-        return templates_instance
+        return SmartFastApiTemplates(
+            config.template_dir,
+            debug_mode=config.debug_mode,
+            api_path_prefix=config.api_prefix,
+            auto_reload=config.auto_reload
+        )
     
     return get_templates
 
@@ -2,18 +2,183 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import json
 import logging
-from datetime import datetime
+import math
+import os
+import time
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Collection, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
+from uuid import UUID
+
+from jinja2 import FileSystemBytecodeCache, Template, TemplateError, TemplateNotFound
+from pydantic import BaseModel
 
 from .core import RenderError, SmartTemplateRegistry, SmartTemplates, TemplateErrorDetail
 
 try:
-    import pytest
-    PYTEST_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PYTEST_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Resolved once rather than per instance; keeps the historical logger name
+_LOGGER = logging.getLogger(f"{__name__}.SmartPytestTemplates")
+
+# Importing pytest is slow, so only check that it is installed here and
+# defer the import until a version is actually needed
+PYTEST_AVAILABLE = importlib.util.find_spec("pytest") is not None
+
+# Default template names of the generate_* methods, compiled ahead of first use
+_DEFAULT_TEMPLATES = (
+    "test_report.html",
+    "fixtures.py.j2",
+    "test_cases.py.j2",
+    "test_docs.md",
+    "mock_objects.py.j2",
+    "api_tests.py.j2",
+    "performance_tests.py.j2",
+    "test_matrix.py.j2",
+)
+
+# Cap on context keys described in error details, so huge inputs that
+# caused a failure are not walked again while reporting it
+_MAX_ERROR_CONTEXT_KEYS = 500
+
+# Renders producing less output than this are cheaper to redo than to cache
+_MIN_CACHED_CONTENT = 512
+
+# Total characters of rendered output memoized per instance; single renders
+# above an eighth of it are not cached, so one large report cannot flush the rest
+_RENDER_CACHE_MAX_CHARS = 4 * 1024 * 1024
+
+# Generated files below this size are written with the default buffer
+_SMALL_FILE_BYTES = 4 * 1024
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _get_pytest_version() -> str:
+    """Return the installed pytest version, importing pytest on first use."""
+    try:
+        import pytest
+    except ImportError:
+        return "not_available"
+    return pytest.__version__
+
+
+def _datetime_from_ns(ns: int) -> datetime:
+    """Local datetime for epoch nanoseconds, exact to the microsecond."""
+    return datetime.fromtimestamp(ns // 1_000_000_000).replace(
+        microsecond=ns // 1000 % 1_000_000
+    )
+
+
+def _ns_from_datetime(value: datetime) -> int:
+    """Epoch nanoseconds for a datetime, exact to the microsecond."""
+    return int(value.replace(microsecond=0).timestamp()) * 1_000_000_000 + (
+        value.microsecond * 1000
+    )
+
+
+def _ts_format(ns: int, fmt: str = "%Y-%m-%dT%H:%M:%S") -> str:
+    """Jinja filter formatting an epoch-nanosecond timestamp in local time."""
+    return _datetime_from_ns(ns).strftime(fmt)
+
+
+def _flatten(context: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Materialize a context for Jinja, which copies it into a dict on render.
+
+    Merging ChainMap layers directly is an order of magnitude faster than
+    dict(ChainMap), which resolves every key through the chain.
+    """
+    if not isinstance(context, ChainMap):
+        return dict(context)
+    flat: dict[str, Any] = {}
+    for layer in reversed(context.maps):
+        flat.update(layer)
+    return flat
+
+
+def _file_has_bytes(path: str, data: bytes) -> bool:
+    """Whether the file at path exists with exactly the given content."""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _cache_key_value(value: Any) -> Any:
+    """
+    Exact JSON form of a render cache key input; TypeError if it has none.
+
+    Plain str/int/float/bool/None map to themselves, as JSON keeps them apart.
+    Everything else becomes a [type, payload] pair in iteration order, so
+    inputs that can render differently (dict order, tuple vs list, Path vs
+    str) never share a key.
+    """
+    value_type = type(value)
+    if value_type in (str, int, bool, type(None)) or (
+        value_type is float and math.isfinite(value)
+    ):
+        return value
+    tag = f"{value_type.__module__}.{value_type.__qualname__}"
+    if isinstance(value, Mapping):
+        return [
+            tag,
+            [[_cache_key_value(k), _cache_key_value(v)] for k, v in value.items()],
+        ]
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [tag, [_cache_key_value(item) for item in value]]
+    if isinstance(value, BaseModel):
+        return [tag, [[name, _cache_key_value(v)] for name, v in value]]
+    if isinstance(value, Enum):
+        return [tag, value.name]
+    if isinstance(value, (date, Decimal, Path, UUID, float)):
+        return [tag, str(value)]
+    raise TypeError(f"{value_type.__name__} is not cacheable")
+
+
+def _type_names(objects: Iterable[Any]) -> list[str]:
+    """Distinct type names in first-seen order, deduplicating types before names."""
+    return list(dict.fromkeys(t.__name__ for t in dict.fromkeys(map(type, objects))))
+
+
+def _count(items: Iterable[Any]) -> str:
+    """Item count for error context, without consuming one-shot iterables."""
+    return str(len(items)) if isinstance(items, Collection) else "unknown"
+
+
+def _canonical_json(value: Any) -> bytes:
+    """Serialize a render cache key input as exact, order-preserving JSON bytes."""
+    key_value = _cache_key_value(value)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(key_value)
+    return json.dumps(key_value, separators=(",", ":")).encode()
+
+
+class InMemoryWriter:
+    """Output writer that keeps generated files in memory instead of on disk."""
+
+    def __init__(self) -> None:
+        self.files: dict[Path, str] = {}
+
+    def __call__(self, content: str, filepath: Path) -> bool:
+        self.files[filepath] = content
+        return True
 
 
 class SmartPytestTemplates(SmartTemplates):
@@ -29,6 +194,10 @@ class SmartPytestTemplates(SmartTemplates):
         registry: SmartTemplateRegistry | None = None,
         debug_mode: bool = False,
         output_dir: str = "test_reports",
+        bytecode_cache_dir: str | None = None,
+        batch_timestamp: datetime | None = None,
+        warmup: bool = True,
+        writer: Callable[[str, Path], bool] | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -39,221 +208,667 @@ class SmartPytestTemplates(SmartTemplates):
             registry: Template registry instance
             debug_mode: Enable debug mode for enhanced error reporting
             output_dir: Directory for generated test files and reports
+            bytecode_cache_dir: Directory for compiled template bytecode, best
+                kept outside output_dir (None, the default, disables the cache).
+                Entries are keyed by template name and source checksum, so
+                edited templates are recompiled automatically and the directory
+                can be shared by parallel workers (e.g. pytest-xdist)
+            batch_timestamp: Timestamp shared by every generated file (None uses
+                the time of each generate_* or batch call). Rendered output is
+                only memoized while it is set, as it is part of the output
+            warmup: Compile the default generator templates up front
+            writer: Callable persisting (content, filepath) and returning success;
+                defaults to writing files under output_dir (see InMemoryWriter)
             **kwargs: Additional Jinja2 environment options
         """
+        # Reuse compiled templates across runs when the caller names a cache
+        # directory, unless it supplies its own bytecode_cache or shares an
+        # existing environment
+        if bytecode_cache_dir is not None and not kwargs.keys() & {
+            "bytecode_cache",
+            "environment",
+        }:
+            cache_path = Path(bytecode_cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            kwargs["bytecode_cache"] = FileSystemBytecodeCache(
+                directory=str(cache_path), pattern="%s.cache"
+            )
+
+        # Only re-check template sources for changes while debugging; outside
+        # it compiled templates are never evicted, as sources do not change
+        kwargs.setdefault("auto_reload", debug_mode)
+        if not debug_mode:
+            kwargs.setdefault("cache_size", -1)
+
         super().__init__(directory, registry=registry, debug_mode=debug_mode, **kwargs)
-        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._logger = _LOGGER
+        self._run_defaults: dict[str, Any] | None = None
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(self._output_dir_str)
+        self.batch_timestamp = batch_timestamp
+        self._writer = writer or self._write_output_file
+        self.env.filters.setdefault("ts_format", _ts_format)
+
+        # Rendered output keyed by template name + input, so repeated
+        # generator calls with identical input skip rendering entirely
+        self._render_cache: OrderedDict[str, str] = OrderedDict()
+        self._render_cache_max = 512
+        self._render_cache_chars = 0
+
+        # Compiled templates by name, skipping the environment's lookup and
+        # LRU bookkeeping on repeat renders
+        self._compiled_templates: dict[str, Template] = {}
+        self._missing_templates: set[str] = set()
+
+        if warmup:
+            self._warm_default_templates()
+
+    def _warm_default_templates(self) -> None:
+        """Load default templates so the first generate_* call skips compilation."""
+        for name in _DEFAULT_TEMPLATES:
+            try:
+                template = self.env.get_template(name)
+            except TemplateError:
+                # Missing or broken templates are reported when actually rendered,
+                # and not remembered as missing in case they are added later
+                continue
+            if not self.debug_mode:
+                self._compiled_templates[name] = template
+
+    def set_debug_mode(self, debug: bool = True, auto_reload: bool | None = None) -> None:
+        """
+        Enable or disable debug mode with template auto-reloading.
 
-    def _prepare_test_context(self, base_context: dict[str, Any]) -> dict[str, Any]:
-        """Prepare context with pytest-specific variables."""
-        # CRITICAL: Defensive copy - never mutate input
-        template_context = base_context.copy()
-        template_context.setdefault("debug_mode", self.debug_mode)
-        template_context.setdefault("timestamp", datetime.now())
-        template_context.setdefault("output_dir", str(self.output_dir))
-        
-        # Add pytest version if available
-        if PYTEST_AVAILABLE:
-            template_context.setdefault("pytest_version", pytest.__version__)
+        Args:
+            debug: Enable debug mode
+            auto_reload: Enable template auto-reloading (defaults to debug value)
+        """
+        super().set_debug_mode(debug)
+        # A shared environment's reload policy belongs to its owner
+        if self._owns_env:
+            self.env.auto_reload = debug if auto_reload is None else auto_reload
+        # Templates compiled before the switch would otherwise mask edits
+        self.invalidate_template_cache()
+
+    @property
+    def output_dir(self) -> Path:
+        """Directory generated files are written under."""
+        return self._output_dir
+
+    @output_dir.setter
+    def output_dir(self, value: str | Path) -> None:
+        self._output_dir = Path(value)
+        # Joined with os.path and only wrapped in a Path at the I/O boundary
+        self._output_dir_str = str(self._output_dir)
+        # Directories known to exist, so bulk writes skip redundant mkdir calls
+        self._known_dirs: set[str] = set()
+        # Run defaults expose output_dir, so rebuild them on the next render
+        self._run_defaults = None
+
+    @property
+    def batch_timestamp(self) -> datetime | None:
+        """Fixed timestamp for every generated file, or None to stamp each call."""
+        return self._batch_timestamp
+
+    @batch_timestamp.setter
+    def batch_timestamp(self, value: datetime | None) -> None:
+        self._batch_timestamp = value
+        # Converted once, so each render only looks the fixed stamp up
+        self._batch_stamp: dict[str, Any] | None = (
+            None
+            if value is None
+            else {"timestamp_ns": _ns_from_datetime(value), "timestamp": value}
+        )
+
+    def _call_stamp(self) -> dict[str, Any]:
+        """Timestamp context for one generate_* or batch call."""
+        if self._batch_stamp is not None:
+            return self._batch_stamp
+        # One clock read backs both timestamp forms
+        timestamp_ns = time.time_ns()
+        return {
+            "timestamp_ns": timestamp_ns,
+            "timestamp": _datetime_from_ns(timestamp_ns),
+        }
+
+    @cached_property
+    def _pytest_version(self) -> str:
+        """Installed pytest version, resolved on first render rather than at import."""
+        return _get_pytest_version()
+
+    def _get_template(self, name: str) -> Template:
+        """Return the compiled template, memoized per instance outside debug mode."""
+        # Templates may change on disk while debugging, so defer to the
+        # environment's auto-reload checks there
+        if self.debug_mode:
+            return self.env.get_template(name)
+        if name in self._missing_templates:
+            raise TemplateNotFound(name)
+        template = self._compiled_templates.get(name)
+        if template is None:
+            try:
+                template = self.env.get_template(name)
+            except TemplateNotFound:
+                # Remember the miss so later calls skip the loader search path
+                self._missing_templates.add(name)
+                raise
+            self._compiled_templates[name] = template
+        return template
+
+    def _missing_template_error(
+        self, template_name: str, template_context: Mapping[str, Any]
+    ) -> RenderError:
+        """Build the TemplateNotFound error without probing the loader again."""
+        error = TemplateErrorDetail(
+            error_type="TemplateNotFound",
+            message=f"Template '{template_name}' not found in template directory",
+            template_name=template_name,
+            context_data=self._error_context_types(template_context),
+        )
+        return RenderError(error=error)
+
+    def _error_context_types(self, context: Mapping[str, Any]) -> dict[str, str]:
+        """Describe context types for an error report, bounded in key count."""
+        return self._extract_context_types(context, max_keys=_MAX_ERROR_CONTEXT_KEYS)
+
+    def _render_template(
+        self, template_name: str, template_context: Mapping[str, Any]
+    ) -> tuple[str, RenderError | None]:
+        """Render through the compiled-template cache; render_safe reports failures."""
+        try:
+            template = self._get_template(template_name)
+        except TemplateNotFound:
+            return "", self._missing_template_error(template_name, template_context)
+        except Exception:
+            return self.render_safe(template_name, template_context)
+
+        try:
+            return template.render(_flatten(template_context)), None
+        except Exception:
+            # Failures are rare; re-run through render_safe for error details
+            return self.render_safe(template_name, template_context)
+
+    def invalidate_template_cache(self) -> None:
+        """Forget compiled, missing and rendered templates, e.g. after editing them."""
+        self._compiled_templates.clear()
+        self._missing_templates.clear()
+        self.clear_render_cache()
+
+    def clear_bytecode_cache(self) -> None:
+        """Remove cached template bytecode, e.g. after editing templates in place."""
+        if self.env.bytecode_cache is not None:
+            self.env.bytecode_cache.clear()
+
+    def clear_render_cache(self) -> None:
+        """Drop all memoized render results."""
+        self._render_cache.clear()
+        self._render_cache_chars = 0
+
+    def _cache_key(self, template_name: str, key_context: Any) -> str | None:
+        """Hash template name and exact JSON input; None if it has no exact form."""
+        try:
+            payload = _canonical_json(key_context)
+        except (TypeError, ValueError, RecursionError):
+            return None
+        return hashlib.blake2b(
+            template_name.encode() + b"\0" + payload, digest_size=16
+        ).hexdigest()
+
+    def _render_cached(
+        self, template_name: str, template_context: Mapping[str, Any], key_context: Any
+    ) -> tuple[str, RenderError | None]:
+        """
+        Render a template, memoizing successful non-trivial results by input.
+
+        Args:
+            template_name: Template to render
+            template_context: Fully prepared template context
+            key_context: Caller input the output depends on (excludes timestamp)
+
+        Returns:
+            Tuple of (rendered_content, error_or_none)
+        """
+        # Templates may change on disk while debugging, and output stamped
+        # with the time of each call never repeats, so only memoize renders
+        # under a fixed batch timestamp
+        key = (
+            None
+            if self.debug_mode or self._batch_stamp is None
+            else self._cache_key(
+                template_name, [self._batch_stamp["timestamp_ns"], key_context]
+            )
+        )
+        if key is not None:
+            cached = self._render_cache.get(key)
+            if cached is not None:
+                self._render_cache.move_to_end(key)
+                return cached, None
+
+        content, error = self._render_template(template_name, template_context)
+
+        # Tiny outputs come from cheap renders; caching them only pollutes the LRU
+        if (
+            key is not None
+            and error is None
+            and _MIN_CACHED_CONTENT <= len(content) <= _RENDER_CACHE_MAX_CHARS // 8
+            and key not in self._render_cache
+        ):
+            self._render_cache[key] = content
+            self._render_cache_chars += len(content)
+            # Evict least recently used entries until both limits hold
+            while (
+                len(self._render_cache) > self._render_cache_max
+                or self._render_cache_chars > _RENDER_CACHE_MAX_CHARS
+            ):
+                _, evicted = self._render_cache.popitem(last=False)
+                self._render_cache_chars -= len(evicted)
+
+        return content, error
+
+    def render_batch(
+        self, template_name: str, contexts: list[dict[str, Any]]
+    ) -> list[tuple[str, RenderError | None]]:
+        """
+        Render one template against many contexts, resolving the template once.
+
+        Args:
+            template_name: Template to render
+            contexts: Contexts to render, each prepared like generator input
+
+        Returns:
+            List of (rendered_content, error_or_none) tuples, one per context
+        """
+        return self._render_batch(template_name, contexts, self._call_stamp())
+
+    def _render_batch(
+        self,
+        template_name: str,
+        contexts: list[dict[str, Any]],
+        stamp: Mapping[str, Any],
+    ) -> list[tuple[str, RenderError | None]]:
+        """render_batch with the timestamp context shared by the whole batch."""
+        try:
+            template = self._get_template(template_name)
+        except TemplateNotFound:
+            return [
+                ("", self._missing_template_error(template_name, context))
+                for context in contexts
+            ]
+        except Exception:
+            # Let render_safe build the structured error for each item
+            return [
+                self.render_safe(
+                    template_name, self._prepare_test_context(context, stamp=stamp)
+                )
+                for context in contexts
+            ]
+
+        results: list[tuple[str, RenderError | None]] = []
+        for context in contexts:
+            template_context = self._prepare_test_context(context, stamp=stamp)
+            try:
+                results.append((template.render(_flatten(template_context)), None))
+            except Exception:
+                # Failures are rare; re-run through render_safe for error details
+                results.append(self.render_safe(template_name, template_context))
+        return results
+
+    def generate_batch(
+        self,
+        jobs: Iterable[tuple[str, dict[str, Any], str | None]],
+        *,
+        max_workers: int = 1,
+    ) -> list[tuple[str, RenderError | None]]:
+        """
+        Render and write many (template, context, output file) jobs in one pass.
+
+        Jobs sharing a template are rendered together through render_batch, so
+        each template is resolved once however many jobs use it. Rendering
+        stays on the calling thread; with max_workers above 1 the writes are
+        spread over a thread pool, one per output file.
+
+        Args:
+            jobs: (template_name, context, output_file) tuples; a falsy
+                output_file renders without writing
+            max_workers: Number of threads used to write output files
+
+        Returns:
+            List of (rendered_content, error_or_none) tuples in job order
+        """
+        jobs = list(jobs)
+        groups: dict[str, list[int]] = {}
+        for index, (template_name, _, _) in enumerate(jobs):
+            groups.setdefault(template_name, []).append(index)
+
+        # Every job in the batch carries the same timestamp
+        stamp = self._call_stamp()
+        results: list[tuple[str, RenderError | None]] = [("", None)] * len(jobs)
+        for template_name, indices in groups.items():
+            rendered = self._render_batch(
+                template_name, [jobs[index][1] for index in indices], stamp
+            )
+            for index, result in zip(indices, rendered):
+                results[index] = result
+
+        # Later jobs for the same file win, as they would writing in order
+        writes: dict[Path, tuple[str, str]] = {}
+        for (template_name, _, output_file), (content, error) in zip(jobs, results):
+            if error:
+                self._logger.error(
+                    "Failed to render %s: %s", template_name, error.error.message
+                )
+            elif output_file:
+                output_path = Path(os.path.join(self._output_dir_str, output_file))
+                writes.pop(output_path, None)
+                writes[output_path] = (template_name, content)
+
+        def write(item: tuple[Path, tuple[str, str]]) -> None:
+            output_path, (template_name, content) = item
+            if self._writer(content, output_path):
+                self._logger.info("Wrote %s to: %s", template_name, output_path)
+
+        if max_workers > 1 and len(writes) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(write, writes.items()))
         else:
-            template_context.setdefault("pytest_version", "not_available")
-        
-        return template_context
+            for item in writes.items():
+                write(item)
+        return results
+
+    def _prepare_test_context(
+        self,
+        base_context: Mapping[str, Any],
+        defaults: Mapping[str, Any] | None = None,
+        *,
+        stamp: Mapping[str, Any] | None = None,
+    ) -> ChainMap[str, Any]:
+        """Prepare context with pytest-specific variables."""
+        # Run-level values have a fixed shape, so build them once and rebuild
+        # only when a setting behind them changes. The timestamp is layered
+        # separately, per call unless batch_timestamp fixes it; templates
+        # needing the time of each render can call {{ timestamp_fn() }}
+        run_defaults = self._run_defaults
+        if run_defaults is None or run_defaults["debug_mode"] != self.debug_mode:
+            run_defaults = self._run_defaults = {
+                "debug_mode": self.debug_mode,
+                "timestamp_fn": datetime.now,
+                "output_dir": self._output_dir_str,
+                "pytest_version": self._pytest_version,
+            }
+        if stamp is None:
+            stamp = self._call_stamp()
+
+        # CRITICAL: Never mutate input - the caller's mapping is layered over
+        # the shared defaults, and later writes land in the empty top overlay
+        if defaults:
+            return ChainMap({}, base_context, defaults, stamp, run_defaults)
+        return ChainMap({}, base_context, stamp, run_defaults)
 
     def _write_output_file(self, content: str, filepath: Path) -> bool:
         """Write generated content to file with error handling."""
         try:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            filepath.write_text(content, encoding="utf-8")
-            self._logger.info(f"Generated test file: {filepath}")
+            path = os.fspath(filepath)
+            data = content.encode("utf-8")
+
+            # Leave byte-identical files alone so mtimes and file watchers stay quiet
+            if _file_has_bytes(path, data):
+                self._logger.debug("Generated test file unchanged: %s", filepath)
+                return True
+
+            # Large outputs go out through one tuned buffer; small ones use the default
+            buffering = _WRITE_BUFFER_SIZE if len(data) >= _SMALL_FILE_BYTES else -1
+
+            def write() -> None:
+                with open(path, "wb", buffering=buffering) as f:
+                    f.write(data)
+
+            self._write_in_dir(os.path.dirname(path), write)
+            self._logger.info("Generated test file: %s", filepath)
             return True
         except Exception as e:
-            self._logger.error(f"Failed to write file {filepath}: {e}")
+            # The directory may have been removed since it was created
+            self._known_dirs.discard(os.path.dirname(os.fspath(filepath)))
+            self._logger.error("Failed to write file %s: %s", filepath, e)
             return False
 
-    def generate_test_report(
+    def _ensure_dir(self, directory: str) -> None:
+        """Create directory (and parents) unless this instance already has."""
+        if directory not in self._known_dirs:
+            os.makedirs(directory or ".", exist_ok=True)
+            self._known_dirs.add(directory)
+
+    def _write_in_dir(self, directory: str, write: Callable[[], None]) -> None:
+        """Run write after ensuring directory, recreating it once if removed."""
+        self._ensure_dir(directory)
+        try:
+            write()
+        except FileNotFoundError:
+            # Deleted since this instance created it (e.g. a cleaned-up tmp dir)
+            self._known_dirs.discard(directory)
+            self._ensure_dir(directory)
+            write()
+
+    def _stream_output_file(
+        self, template_name: str, template_context: Mapping[str, Any], filepath: Path
+    ) -> None:
+        """Render a template to disk chunk by chunk, replacing filepath atomically."""
+        template = self._get_template(template_name)
+        context = _flatten(template_context)
+        tmp_path = filepath.with_name(f"{filepath.name}.tmp")
+
+        def write() -> None:
+            template.stream(context).dump(str(tmp_path), encoding="utf-8")
+            tmp_path.replace(filepath)
+
+        try:
+            self._write_in_dir(os.path.dirname(os.fspath(filepath)), write)
+        except OSError:
+            self._known_dirs.discard(os.path.dirname(os.fspath(filepath)))
+            raise
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _add_report_counts(self, template_context: ChainMap[str, Any]) -> None:
+        """Derive test totals from result statuses in a single pass."""
+        if {"total_tests", "passed_tests", "failed_tests"} <= template_context.keys():
+            return
+        tests = template_context.get("tests", ())
+        # Plain counters beat Counter here: only two statuses are reported.
+        # The literals are interned by the compiler and str caches its hash,
+        # so sys.intern'd key/value constants would not speed up the lookups
+        passed = failed = 0
+        for test in tests:
+            status = test.get("status")
+            if status == "passed":
+                passed += 1
+            elif status == "failed":
+                failed += 1
+        template_context.setdefault("total_tests", len(tests))
+        template_context.setdefault("passed_tests", passed)
+        template_context.setdefault("failed_tests", failed)
+
+    def _generate(
         self,
-        test_results: dict[str, Any],
+        template_name: str,
+        base_context: Mapping[str, Any],
+        output_file: str | None,
         *,
-        template_name: str = "test_report.html",
-        output_file: str | None = None,
+        label: str,
+        defaults: Mapping[str, Any] | None = None,
+        customize: Callable[[ChainMap[str, Any]], None] | None = None,
+        key_context: Any = None,
+        error_count: tuple[str, str] | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
-        Generate test execution reports from pytest results.
+        Shared render-and-write pipeline behind the generate_* methods.
 
         Args:
-            test_results: Dictionary containing test execution data
-            template_name: Template to use for report generation
-            output_file: Optional output file path
+            template_name: Template to render
+            base_context: Generator input, layered under pytest defaults
+            output_file: Optional output file path, relative to output_dir
+            label: Human-readable output name used in log messages
+            defaults: Extra defaults applied unless the input overrides them
+            customize: Hook adding derived values to the prepared context
+            key_context: Render cache key input (defaults to base_context)
+            error_count: (error key, base_context key) pair; on failure the error
+                context reports that input's size instead of base_context types
+            stream: Render straight into output_file and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
         try:
-            # CRITICAL: Defensive copy of input context
-            template_context = self._prepare_test_context(test_results)
-
-            # Add test-specific context
-            template_context.setdefault("report_type", "test_execution")
-            template_context.setdefault(
-                "total_tests", len(test_results.get("tests", []))
-            )
-            template_context.setdefault(
-                "passed_tests",
-                len(
-                    [
-                        t
-                        for t in test_results.get("tests", [])
-                        if t.get("status") == "passed"
-                    ]
-                ),
-            )
-            template_context.setdefault(
-                "failed_tests",
-                len(
-                    [
-                        t
-                        for t in test_results.get("tests", [])
-                        if t.get("status") == "failed"
-                    ]
-                ),
+            # CRITICAL: Input is layered, never mutated
+            template_context = self._prepare_test_context(base_context, defaults)
+            if customize is not None:
+                customize(template_context)
+
+            # Streaming renders straight to disk, so custom writers get content
+            if stream and output_file and self._writer == self._write_output_file:
+                output_path = Path(os.path.join(self._output_dir_str, output_file))
+                self._stream_output_file(template_name, template_context, output_path)
+                self._logger.info("Streamed %s to: %s", label, output_path)
+                return "", None
+
+            content, error = self._render_cached(
+                template_name,
+                template_context,
+                base_context if key_context is None else key_context,
             )
 
-            content, error = self.render_safe(template_name, template_context)
-
             if error:
                 self._logger.error(
-                    f"Failed to render test report template: {error.error.message}"
+                    "Failed to render %s template: %s", label, error.error.message
                 )
                 return "", error
 
             if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"Test report written to: {output_path}")
+                output_path = Path(os.path.join(self._output_dir_str, output_file))
+                if self._writer(content, output_path):
+                    self._logger.info("Wrote %s to: %s", label, output_path)
 
             return content, None
 
         except Exception as e:
-            self._logger.exception("Unexpected error in test report generation")
+            self._logger.exception("Unexpected error in %s generation", label)
             error = TemplateErrorDetail(
                 error_type=type(e).__name__,
                 message=str(e),
                 template_name=template_name,
-                context_data=self._extract_context_types(test_results),
+                context_data=(
+                    self._error_context_types(base_context)
+                    if error_count is None
+                    else {error_count[0]: _count(base_context[error_count[1]])}
+                ),
             )
             return "", RenderError(error=error)
 
+    def generate_test_report(
+        self,
+        test_results: dict[str, Any],
+        *,
+        template_name: str = "test_report.html",
+        output_file: str | None = None,
+        stream: bool = False,
+    ) -> tuple[str, RenderError | None]:
+        """
+        Generate test execution reports from pytest results.
+
+        Args:
+            test_results: Dictionary containing test execution data
+            template_name: Template to use for report generation
+            output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
+
+        Returns:
+            Tuple of (rendered_content, error_or_none)
+        """
+        return self._generate(
+            template_name,
+            test_results,
+            output_file,
+            label="test report",
+            defaults={"report_type": "test_execution"},
+            customize=self._add_report_counts,
+            stream=stream,
+        )
+
     def generate_pytest_fixtures(
         self,
-        model_objects: list[Any],
+        model_objects: Iterable[Any],
         *,
         fixture_template: str = "fixtures.py.j2",
         output_file: str | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
         Generate pytest fixtures from business objects.
 
         Args:
-            model_objects: List of model objects to create fixtures for
+            model_objects: Model objects to create fixtures for; one-shot
+                iterables are passed through without object_types
             fixture_template: Template to use for fixture generation
             output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
-        try:
-            base_context = {
-                "objects": model_objects,
-                "fixture_type": "pytest_fixtures",
-                "object_types": list(set(type(obj).__name__ for obj in model_objects)),
-            }
-
-            # CRITICAL: Defensive copy through _prepare_test_context
-            template_context = self._prepare_test_context(base_context)
-
-            content, error = self.render_safe(fixture_template, template_context)
-
-            if error:
-                self._logger.error(
-                    f"Failed to render pytest fixtures template: {error.error.message}"
-                )
-                return "", error
-
-            if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"Pytest fixtures written to: {output_path}")
-
-            return content, None
-
-        except Exception as e:
-            self._logger.exception("Unexpected error in pytest fixture generation")
-            error = TemplateErrorDetail(
-                error_type=type(e).__name__,
-                message=str(e),
-                template_name=fixture_template,
-                context_data={"object_count": len(model_objects)},
-            )
-            return "", RenderError(error=error)
+        base_context: dict[str, Any] = {
+            "objects": model_objects,
+            "fixture_type": "pytest_fixtures",
+        }
+        if isinstance(model_objects, Collection):
+            base_context["object_types"] = _type_names(model_objects)
+        return self._generate(
+            fixture_template,
+            base_context,
+            output_file,
+            label="pytest fixtures",
+            error_count=("object_count", "objects"),
+            stream=stream,
+        )
 
     def generate_test_cases(
         self,
-        objects: list[Any],
+        objects: Iterable[Any],
         *,
         test_template: str = "test_cases.py.j2",
         parametrize: bool = True,
         output_file: str | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
         Generate parametrized test cases from objects.
 
         Args:
-            objects: List of objects to create test cases for
+            objects: Objects to create test cases for; one-shot iterables are
+                passed through without object_types
             test_template: Template to use for test case generation
             parametrize: Whether to use pytest.mark.parametrize
             output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
-        try:
-            base_context = {
-                "test_objects": objects,
-                "parametrize": parametrize,
-                "test_type": "parametrized" if parametrize else "individual",
-                "object_types": list(set(type(obj).__name__ for obj in objects)),
-            }
-
-            # CRITICAL: Defensive copy through _prepare_test_context
-            template_context = self._prepare_test_context(base_context)
-
-            content, error = self.render_safe(test_template, template_context)
-
-            if error:
-                self._logger.error(
-                    f"Failed to render test cases template: {error.error.message}"
-                )
-                return "", error
-
-            if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"Test cases written to: {output_path}")
-
-            return content, None
-
-        except Exception as e:
-            self._logger.exception("Unexpected error in test case generation")
-            error = TemplateErrorDetail(
-                error_type=type(e).__name__,
-                message=str(e),
-                template_name=test_template,
-                context_data={"object_count": len(objects)},
-            )
-            return "", RenderError(error=error)
+        base_context: dict[str, Any] = {
+            "test_objects": objects,
+            "parametrize": parametrize,
+            "test_type": "parametrized" if parametrize else "individual",
+        }
+        if isinstance(objects, Collection):
+            base_context["object_types"] = _type_names(objects)
+        return self._generate(
+            test_template,
+            base_context,
+            output_file,
+            label="test cases",
+            error_count=("object_count", "test_objects"),
+            stream=stream,
+        )
 
     def generate_test_documentation(
         self,
@@ -262,6 +877,7 @@ class SmartPytestTemplates(SmartTemplates):
         doc_template: str = "test_docs.md",
         format_type: str = "markdown",
         output_file: str | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
         Generate test documentation from templates.
@@ -271,96 +887,56 @@ class SmartPytestTemplates(SmartTemplates):
             doc_template: Template to use for documentation generation
             format_type: Format type (markdown, html, etc.)
             output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
-        try:
-            # CRITICAL: Create copy before modifying
-            base_context = test_data.copy()
-            base_context.setdefault("format_type", format_type)
-            base_context.setdefault("doc_type", "test_documentation")
-
-            # CRITICAL: Defensive copy through _prepare_test_context
-            template_context = self._prepare_test_context(base_context)
-
-            content, error = self.render_safe(doc_template, template_context)
-
-            if error:
-                self._logger.error(
-                    f"Failed to render test documentation template: {error.error.message}"
-                )
-                return "", error
-
-            if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"Test documentation written to: {output_path}")
-
-            return content, None
-
-        except Exception as e:
-            self._logger.exception("Unexpected error in test documentation generation")
-            error = TemplateErrorDetail(
-                error_type=type(e).__name__,
-                message=str(e),
-                template_name=doc_template,
-                context_data=self._extract_context_types(test_data),
-            )
-            return "", RenderError(error=error)
+        return self._generate(
+            doc_template,
+            test_data,
+            output_file,
+            label="test documentation",
+            defaults={"format_type": format_type, "doc_type": "test_documentation"},
+            key_context=[format_type, test_data],
+            stream=stream,
+        )
 
     def generate_mock_objects(
         self,
-        object_specs: list[dict[str, Any]],
+        object_specs: Iterable[dict[str, Any]],
         *,
         mock_template: str = "mock_objects.py.j2",
         output_file: str | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
         Generate mock objects for testing from specifications.
 
         Args:
-            object_specs: List of dictionaries specifying object properties
+            object_specs: Dictionaries specifying object properties; one-shot
+                iterables are passed through without spec_count
             mock_template: Template to use for mock generation
             output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
-        try:
-            base_context = {
-                "mock_specs": object_specs,
-                "mock_type": "pytest_mocks",
-                "spec_count": len(object_specs),
-            }
-
-            # CRITICAL: Defensive copy through _prepare_test_context
-            template_context = self._prepare_test_context(base_context)
-
-            content, error = self.render_safe(mock_template, template_context)
-
-            if error:
-                self._logger.error(
-                    f"Failed to render mock objects template: {error.error.message}"
-                )
-                return "", error
-
-            if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"Mock objects written to: {output_path}")
-
-            return content, None
-
-        except Exception as e:
-            self._logger.exception("Unexpected error in mock object generation")
-            error = TemplateErrorDetail(
-                error_type=type(e).__name__,
-                message=str(e),
-                template_name=mock_template,
-                context_data={"spec_count": len(object_specs)},
-            )
-            return "", RenderError(error=error)
+        base_context: dict[str, Any] = {
+            "mock_specs": object_specs,
+            "mock_type": "pytest_mocks",
+        }
+        if isinstance(object_specs, Collection):
+            base_context["spec_count"] = len(object_specs)
+        return self._generate(
+            mock_template,
+            base_context,
+            output_file,
+            label="mock objects",
+            error_count=("spec_count", "mock_specs"),
+            stream=stream,
+        )
 
     def generate_api_tests(
         self,
@@ -369,6 +945,7 @@ class SmartPytestTemplates(SmartTemplates):
         api_test_template: str = "api_tests.py.j2",
         include_auth: bool = False,
         output_file: str | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
         Generate API test cases from endpoint specifications.
@@ -378,46 +955,28 @@ class SmartPytestTemplates(SmartTemplates):
             api_test_template: Template to use for API test generation
             include_auth: Whether to include authentication in tests
             output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
-        try:
-            base_context = {
-                "endpoints": api_endpoints,
-                "include_auth": include_auth,
-                "test_type": "api_tests",
-                "endpoint_count": len(api_endpoints),
-                "methods": list(set(ep.get("method", "GET") for ep in api_endpoints)),
-            }
-
-            # CRITICAL: Defensive copy through _prepare_test_context
-            template_context = self._prepare_test_context(base_context)
-
-            content, error = self.render_safe(api_test_template, template_context)
-
-            if error:
-                self._logger.error(
-                    f"Failed to render API tests template: {error.error.message}"
-                )
-                return "", error
-
-            if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"API tests written to: {output_path}")
-
-            return content, None
-
-        except Exception as e:
-            self._logger.exception("Unexpected error in API test generation")
-            error = TemplateErrorDetail(
-                error_type=type(e).__name__,
-                message=str(e),
-                template_name=api_test_template,
-                context_data={"endpoint_count": len(api_endpoints)},
-            )
-            return "", RenderError(error=error)
+        base_context = {
+            "endpoints": api_endpoints,
+            "include_auth": include_auth,
+            "test_type": "api_tests",
+            "endpoint_count": len(api_endpoints),
+            "methods": list(
+                dict.fromkeys(ep.get("method", "GET") for ep in api_endpoints)
+            ),
+        }
+        return self._generate(
+            api_test_template,
+            base_context,
+            output_file,
+            label="API tests",
+            error_count=("endpoint_count", "endpoints"),
+            stream=stream,
+        )
 
     def generate_performance_tests(
         self,
@@ -426,6 +985,7 @@ class SmartPytestTemplates(SmartTemplates):
         perf_template: str = "performance_tests.py.j2",
         framework: str = "pytest-benchmark",
         output_file: str | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
         Generate performance test cases from specifications.
@@ -435,45 +995,25 @@ class SmartPytestTemplates(SmartTemplates):
             perf_template: Template to use for performance test generation
             framework: Performance testing framework to use
             output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
-        try:
-            base_context = {
-                "perf_specs": performance_specs,
-                "framework": framework,
-                "test_type": "performance_tests",
-                "spec_count": len(performance_specs),
-            }
-
-            # CRITICAL: Defensive copy through _prepare_test_context
-            template_context = self._prepare_test_context(base_context)
-
-            content, error = self.render_safe(perf_template, template_context)
-
-            if error:
-                self._logger.error(
-                    f"Failed to render performance tests template: {error.error.message}"
-                )
-                return "", error
-
-            if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"Performance tests written to: {output_path}")
-
-            return content, None
-
-        except Exception as e:
-            self._logger.exception("Unexpected error in performance test generation")
-            error = TemplateErrorDetail(
-                error_type=type(e).__name__,
-                message=str(e),
-                template_name=perf_template,
-                context_data={"spec_count": len(performance_specs)},
-            )
-            return "", RenderError(error=error)
+        base_context = {
+            "perf_specs": performance_specs,
+            "framework": framework,
+            "test_type": "performance_tests",
+            "spec_count": len(performance_specs),
+        }
+        return self._generate(
+            perf_template,
+            base_context,
+            output_file,
+            label="performance tests",
+            error_count=("spec_count", "perf_specs"),
+            stream=stream,
+        )
 
     def generate_test_matrix(
         self,
@@ -481,6 +1021,7 @@ class SmartPytestTemplates(SmartTemplates):
         *,
         matrix_template: str = "test_matrix.py.j2",
         output_file: str | None = None,
+        stream: bool = False,
     ) -> tuple[str, RenderError | None]:
         """
         Generate test matrix for cross-platform/cross-version testing.
@@ -489,48 +1030,45 @@ class SmartPytestTemplates(SmartTemplates):
             matrix_config: Configuration for test matrix generation
             matrix_template: Template to use for matrix generation
             output_file: Optional output file path
+            stream: Write output_file incrementally and return empty content
 
         Returns:
             Tuple of (rendered_content, error_or_none)
         """
-        try:
-            # CRITICAL: Create copy before modifying
-            base_context = matrix_config.copy()
-            base_context.setdefault("matrix_type", "cross_platform")
-
-            # CRITICAL: Defensive copy through _prepare_test_context
-            template_context = self._prepare_test_context(base_context)
-
-            content, error = self.render_safe(matrix_template, template_context)
-
-            if error:
-                self._logger.error(
-                    f"Failed to render test matrix template: {error.error.message}"
-                )
-                return "", error
-
-            if output_file:
-                output_path = self.output_dir / output_file
-                if self._write_output_file(content, output_path):
-                    self._logger.info(f"Test matrix written to: {output_path}")
+        return self._generate(
+            matrix_template,
+            matrix_config,
+            output_file,
+            label="test matrix",
+            defaults={"matrix_type": "cross_platform"},
+            stream=stream,
+        )
+
+
+@lru_cache(maxsize=None)
+def get_pytest_templates(
+    directory: str, output_dir: str = "test_reports", debug_mode: bool = False
+) -> SmartPytestTemplates:
+    """
+    Return a shared SmartPytestTemplates instance for the given settings.
 
-            return content, None
+    Recommended entry point for fixtures and plugins that render per test:
+    the environment, template warmup and caches are built once per process
+    instead of once per caller. Each call is stamped with its own time; construct
+    SmartPytestTemplates directly to fix batch_timestamp for a whole run.
 
-        except Exception as e:
-            self._logger.exception("Unexpected error in test matrix generation")
-            error = TemplateErrorDetail(
-                error_type=type(e).__name__,
-                message=str(e),
-                template_name=matrix_template,
-                context_data=self._extract_context_types(matrix_config),
-            )
-            return "", RenderError(error=error)
+    Usage:
+        @pytest.fixture(scope="session")
+        def report_templates():
+            return get_pytest_templates("test_templates/")
+    """
+    return SmartPytestTemplates(directory, output_dir=output_dir, debug_mode=debug_mode)
 
 
 # Usage examples:
 # 
 # # Basic test report generation
-# pytest_templates = SmartPytestTemplates("test_templates/")
+# pytest_templates = get_pytest_templates("test_templates/")
 # content, error = pytest_templates.generate_test_report(
 #     test_results, 
 #     output_file="report.html"
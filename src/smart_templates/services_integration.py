@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
-
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateNotFound,
+    nodes,
+)
+from jinja2.ext import Extension
+from jinja2.parser import Parser
 from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
 
 from .core import RenderError, SmartTemplateRegistry, SmartTemplates, TemplateErrorDetail
 
@@ -23,6 +39,157 @@ from .pytest_integration import SmartPytestTemplates
 from .database_integration import SmartDatabaseTemplates
 
 
+# Resolved once rather than per instance; keeps the historical logger name
+_LOGGER = logging.getLogger(f"{__name__}.SmartServiceTemplates")
+
+# Context defaults that never change for the life of the process
+_SERVICE_CONTEXT_DEFAULTS = {
+    "generator": "SmartServiceTemplates",
+    "sqlmodel_available": SQLMODEL_AVAILABLE,
+}
+
+# Field names conventionally searched / filtered on in generated CRUD routes
+_SEARCHABLE_FIELDS = frozenset({"name", "title", "email"})
+_FILTERABLE_FIELDS = frozenset({"status", "type", "category"})
+
+
+@lru_cache(maxsize=None)
+def _classify_model(model_class: type) -> tuple[bool, bool]:
+    """(is_sqlmodel, is_basemodel) for a model class."""
+    return (
+        SQLMODEL_AVAILABLE and issubclass(model_class, SQLModel),
+        issubclass(model_class, BaseModel),
+    )
+
+
+def _field_flags(field_info: Any) -> tuple[Any, Any, Any, Any]:
+    """
+    (primary_key, foreign_key, unique, index) of a field.
+
+    SQLModel keeps these as plain instance attributes, so they are read from
+    the instance dict in one probe each. Plain pydantic fields have none, and
+    unset SQLModel options (PydanticUndefined) read as their defaults.
+    """
+    attrs = getattr(field_info, "__dict__", None)
+    if not attrs:
+        return False, None, False, False
+    flags = (
+        attrs.get("primary_key", False),
+        attrs.get("foreign_key"),
+        attrs.get("unique", False),
+        attrs.get("index", False),
+    )
+    if PydanticUndefined not in flags:
+        return flags
+    return tuple(
+        default if flag is PydanticUndefined else flag
+        for flag, default in zip(flags, (False, None, False, False))
+    )
+
+
+@lru_cache(maxsize=256)
+def _model_metadata(model_class: type) -> dict[str, Any]:
+    """Introspect one model class; classes do not change, so results are cached."""
+    fields = []
+    # model_fields rather than the deprecated __fields__ shim on pydantic v2
+    for field_name, field_info in getattr(model_class, "model_fields", {}).items():
+        primary_key, foreign_key, unique, index = _field_flags(field_info)
+        fields.append({
+            "name": field_name,
+            "type": str(field_info.annotation),
+            "nullable": field_info.default is None,
+            "primary_key": primary_key,
+            "foreign_key": foreign_key,
+            "unique": unique,
+            "searchable": field_name in _SEARCHABLE_FIELDS,
+            "filterable": index or field_name in _FILTERABLE_FIELDS
+        })
+
+    # Identify primary key field
+    primary_key = next((f["name"] for f in fields if f["primary_key"]), "id")
+
+    is_sqlmodel, is_basemodel = _classify_model(model_class)
+    return {
+        "class_name": model_class.__name__,
+        "table_name": getattr(model_class, "__tablename__", model_class.__name__.lower()),
+        "module_name": model_class.__module__,
+        "is_sqlmodel": is_sqlmodel,
+        "is_basemodel": is_basemodel,
+        "fields": fields,
+        "relationships": [],
+        "crud_operations": ["create", "read", "update", "delete"],
+        "primary_key": primary_key,
+    }
+
+
+# Sample value factories for required fields, by field type
+_SAMPLE_FACTORIES: dict[type, Callable[[str], Any]] = {
+    bool: lambda name: True,
+    int: lambda name: 1,
+    float: lambda name: 1.0,
+    str: lambda name: f"Sample {name}",
+    datetime: lambda name: datetime(2024, 1, 1),
+}
+
+
+@lru_cache(maxsize=512)
+def _sample_value_for(annotation: Any, field_name: str) -> Any:
+    """Placeholder value for a required field of the given type, or None."""
+    # Unwrap Optional[X] / X | None to X
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if not isinstance(annotation, type) or issubclass(annotation, Enum):
+        return None
+    # Walking the MRO finds subclasses too, and bool before its int base
+    for base in annotation.__mro__:
+        factory = _SAMPLE_FACTORIES.get(base)
+        if factory is not None:
+            return factory(field_name)
+    return None
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Jinja extension adding a {% cache "name" %}...{% endcache %} tag.
+
+    The block renders once per template and name, and later renders reuse the
+    stored output, so only wrap parts that do not depend on per-render context
+    (imports, helper definitions). Caching is off while env.fragment_cache is
+    None, and the owner clears the cache between generation runs.
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        environment.extend(fragment_cache=None)
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        # Key fragments by template too, so equal names in different templates
+        # do not collide
+        args = [nodes.Const(parser.name), parser.parse_expression()]
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_cache_support", args), [], [], body
+        ).set_lineno(lineno)
+
+    def _cache_support(
+        self, template_name: str | None, name: str, caller: Callable[[], str]
+    ) -> str:
+        cache = self.environment.fragment_cache
+        if cache is None:
+            return caller()
+        key = (template_name, name)
+        rv = cache.get(key)
+        if rv is None:
+            rv = cache[key] = caller()
+        return rv
+
+
 class ServiceGenerationConfig(BaseModel):
     """Configuration for full-stack service generation."""
     
@@ -57,6 +224,15 @@ class SmartServiceTemplates(SmartTemplates):
     templates to generate complete CRUD applications from data models.
     """
 
+    # (template, output file) pairs rendered by _generate_project_config
+    _CONFIG_TEMPLATES = (
+        ("pyproject.toml.j2", "pyproject.toml"),
+        ("requirements.txt.j2", "requirements.txt"),
+        ("README.md.j2", "README.md"),
+        ("docker/Dockerfile.j2", "Dockerfile"),
+        (".env.template.j2", ".env.template"),
+    )
+
     def __init__(
         self,
         directory: str,
@@ -64,6 +240,8 @@ class SmartServiceTemplates(SmartTemplates):
         registry: SmartTemplateRegistry | None = None,
         debug_mode: bool = False,
         output_dir: str = "generated_services",
+        bytecode_cache_dir: str | None = None,
+        fragment_cache: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -74,113 +252,210 @@ class SmartServiceTemplates(SmartTemplates):
             registry: Template registry instance
             debug_mode: Enable debug mode for enhanced error reporting
             output_dir: Directory for generated service projects
+            bytecode_cache_dir: Directory for compiled template bytecode, best
+                kept outside output_dir (None, the default, disables the cache).
+                Shared with the specialized engines; pass bytecode_cache to use
+                another backend
+            fragment_cache: Reuse {% cache %} block output across the models of
+                one generate_full_service run (ignored in debug mode)
             **kwargs: Additional Jinja2 environment options
         """
+        # Skip re-compiling templates on every process start when the caller
+        # names a cache directory, unless it supplies its own bytecode_cache
+        if bytecode_cache_dir is not None and "bytecode_cache" not in kwargs:
+            cache_path = Path(bytecode_cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            kwargs["bytecode_cache"] = FileSystemBytecodeCache(
+                directory=str(cache_path), pattern="%s.cache"
+            )
+
         super().__init__(directory, registry=registry, debug_mode=debug_mode, **kwargs)
-        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._logger = _LOGGER
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize specialized template engines
-        self._setup_specialized_templates()
+        self._template_dir = directory
+        # Directories known to exist, so writing many files skips redundant mkdirs
+        self._known_dirs: set[str] = set()
+
+        # Invariant {% cache %} blocks in per-model templates render once per
+        # run when opted in; disabled while debugging so template edits show
+        # up immediately
+        self._fragment_caching = fragment_cache
+        self.env.add_extension(FragmentCacheExtension)
+        self.env.fragment_cache = {} if fragment_cache and not debug_mode else None
+
+        # Compiled templates by name, so per-model and per-run renders skip
+        # the environment's name lookup; misses are remembered the same way
+        self._compiled_templates: dict[str, Template] = {}
+        self._missing_templates: set[str] = set()
+
+    def clear_bytecode_cache(self) -> None:
+        """Remove cached template bytecode, e.g. after editing templates in place."""
+        if self.env.bytecode_cache is not None:
+            self.env.bytecode_cache.clear()
+
+    def _get_template(self, name: str) -> Template:
+        """Return a compiled template, cached by name outside debug mode."""
+        if self.debug_mode:
+            return self.env.get_template(name)
+        if name in self._missing_templates:
+            raise TemplateNotFound(name)
+        template = self._compiled_templates.get(name)
+        if template is None:
+            try:
+                template = self.env.get_template(name)
+            except TemplateNotFound:
+                self._missing_templates.add(name)
+                raise
+            self._compiled_templates[name] = template
+        return template
+
+    def _render_template(
+        self, template_name: str, template_context: dict[str, Any], **overrides: Any
+    ) -> tuple[str, RenderError | None]:
+        """
+        Render through the compiled-template cache; render_safe reports failures.
 
-    def _setup_specialized_templates(self) -> None:
-        """Initialize the specialized template engines with shared registry."""
+        Overrides are layered over the context by Jinja's own context copy, so
+        per-model renders need no copy of the shared context.
+        """
         try:
-            # Use shared registry for consistency
-            self.fastapi_templates = SmartFastApiTemplates(
-                str(self.env.loader.searchpath[0]),  # Use same template directory
-                registry=self.registry,
-                debug_mode=self.debug_mode
-            )
-            
-            self.pytest_templates = SmartPytestTemplates(
-                str(self.env.loader.searchpath[0]),
-                registry=self.registry,
-                debug_mode=self.debug_mode
+            template = self._get_template(template_name)
+        except TemplateNotFound:
+            error = TemplateErrorDetail(
+                error_type="TemplateNotFound",
+                message=f"Template '{template_name}' not found in template directory",
+                template_name=template_name,
+                context_data=self._extract_context_types(
+                    {**template_context, **overrides}
+                ),
             )
-            
-            self.database_templates = SmartDatabaseTemplates(
-                str(self.env.loader.searchpath[0]),
+            return "", RenderError(error=error)
+        except Exception:
+            return self.render_safe(template_name, {**template_context, **overrides})
+
+        try:
+            return template.render(template_context, **overrides), None
+        except Exception:
+            # Failures are rare; re-run through render_safe for error details
+            return self.render_safe(template_name, {**template_context, **overrides})
+
+    def set_debug_mode(self, debug: bool = True) -> None:
+        """Enable or disable debug mode, bypassing cached fragments while on."""
+        super().set_debug_mode(debug)
+        self.env.fragment_cache = {} if self._fragment_caching and not debug else None
+
+    def invalidate_template_cache(self) -> None:
+        """Forget compiled templates, misses and fragments, e.g. after editing them."""
+        self._compiled_templates.clear()
+        self._missing_templates.clear()
+        if self.env.fragment_cache is not None:
+            self.env.fragment_cache.clear()
+
+    def _build_specialized(self, template_class: type[SmartTemplates]) -> Any:
+        """Build a specialized template engine with the shared registry, or None."""
+        try:
+            # Share the registry and Jinja environment, so a template used by
+            # several engines is loaded and compiled once
+            engine = template_class(
+                self._template_dir,
                 registry=self.registry,
-                debug_mode=self.debug_mode
+                debug_mode=self.debug_mode,
+                environment=self.env,
             )
-            
-            self._logger.info("Specialized template engines initialized successfully")
-            
         except Exception as e:
-            self._logger.error(f"Failed to initialize specialized templates: {e}")
-            # Create minimal fallbacks to prevent crashes
-            self.fastapi_templates = None
-            self.pytest_templates = None
-            self.database_templates = None
+            self._logger.error(
+                "Failed to initialize %s: %s", template_class.__name__, e
+            )
+            return None
+        self._logger.info("Initialized %s", template_class.__name__)
+        return engine
+
+    # Specialized engines are built on first use, so callers that only need
+    # some of them (or none, e.g. API docs) never pay for the others
+
+    @cached_property
+    def fastapi_templates(self) -> SmartFastApiTemplates | None:
+        """FastAPI template engine, or None if it could not be initialized."""
+        return self._build_specialized(SmartFastApiTemplates)
+
+    @cached_property
+    def pytest_templates(self) -> SmartPytestTemplates | None:
+        """Pytest template engine, or None if it could not be initialized."""
+        return self._build_specialized(SmartPytestTemplates)
+
+    @cached_property
+    def database_templates(self) -> SmartDatabaseTemplates | None:
+        """Database template engine, or None if it could not be initialized."""
+        return self._build_specialized(SmartDatabaseTemplates)
+
+    def _component_available(self, name: str) -> bool:
+        """Whether an engine is usable, without building it if not yet needed."""
+        # Unbuilt engines are assumed to build; failures are cached as None
+        return self.__dict__.get(name, True) is not None
 
     def _prepare_service_context(self, base_context: dict[str, Any]) -> dict[str, Any]:
         """Prepare context with service-specific variables."""
-        # CRITICAL: Defensive copy - never mutate input
-        template_context = base_context.copy()
+        # CRITICAL: Defensive copy - never mutate input. Module-constant
+        # defaults go in with the same merge, beneath the caller's values
+        template_context = {**_SERVICE_CONTEXT_DEFAULTS, **base_context}
         template_context.setdefault("debug_mode", self.debug_mode)
-        template_context.setdefault("timestamp", datetime.now())
+        if "timestamp" not in template_context:
+            template_context["timestamp"] = datetime.now()
         template_context.setdefault("output_dir", str(self.output_dir))
-        template_context.setdefault("generator", "SmartServiceTemplates")
         
         # Add component availability
-        template_context.setdefault("fastapi_available", self.fastapi_templates is not None)
-        template_context.setdefault("pytest_available", self.pytest_templates is not None)
-        template_context.setdefault("database_available", self.database_templates is not None)
-        template_context.setdefault("sqlmodel_available", SQLMODEL_AVAILABLE)
-        
+        template_context.setdefault(
+            "fastapi_available", self._component_available("fastapi_templates")
+        )
+        template_context.setdefault(
+            "pytest_available", self._component_available("pytest_templates")
+        )
+        template_context.setdefault(
+            "database_available", self._component_available("database_templates")
+        )
+
         return template_context
 
     def _write_output_file(self, content: str, filepath: Path) -> bool:
         """Write generated content to file with error handling."""
         try:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            filepath.write_text(content, encoding="utf-8")
-            self._logger.info(f"Generated service file: {filepath}")
+            path = os.fspath(filepath)
+            directory = os.path.dirname(path)
+            # Encode once and write bytes, bypassing the text layer
+            data = content.encode("utf-8")
+            self._ensure_dir(directory)
+            try:
+                with open(path, "wb") as f:
+                    f.write(data)
+            except FileNotFoundError:
+                # Deleted since this instance created it; make it again and retry
+                self._known_dirs.discard(directory)
+                self._ensure_dir(directory)
+                with open(path, "wb") as f:
+                    f.write(data)
+            self._logger.info("Generated service file: %s", filepath)
             return True
         except Exception as e:
-            self._logger.error(f"Failed to write file {filepath}: {e}")
+            # The directory may have been removed since it was created
+            self._known_dirs.discard(os.path.dirname(os.fspath(filepath)))
+            self._logger.error("Failed to write file %s: %s", filepath, e)
             return False
 
+    def _ensure_dir(self, directory: str) -> None:
+        """Create directory (and parents) unless this instance already has."""
+        if directory not in self._known_dirs:
+            os.makedirs(directory or ".", exist_ok=True)
+            self._known_dirs.add(directory)
+
     def _extract_model_metadata(self, model_classes: list[type]) -> list[dict[str, Any]]:
-        """Extract metadata from model classes for service generation."""
-        models_metadata = []
-        
-        for model_class in model_classes:
-            model_info = {
-                "class_name": model_class.__name__,
-                "table_name": getattr(model_class, "__tablename__", model_class.__name__.lower()),
-                "module_name": model_class.__module__,
-                "is_sqlmodel": SQLMODEL_AVAILABLE and issubclass(model_class, SQLModel),
-                "is_basemodel": issubclass(model_class, BaseModel),
-                "fields": [],
-                "relationships": [],
-                "crud_operations": ["create", "read", "update", "delete"]
-            }
-            
-            # Extract fields
-            if hasattr(model_class, "__fields__"):
-                for field_name, field_info in model_class.__fields__.items():
-                    field_data = {
-                        "name": field_name,
-                        "type": str(field_info.annotation),
-                        "nullable": field_info.default is None,
-                        "primary_key": getattr(field_info, "primary_key", False),
-                        "foreign_key": getattr(field_info, "foreign_key", None),
-                        "unique": getattr(field_info, "unique", False),
-                        "searchable": field_name in ["name", "title", "email"],  # Common searchable fields
-                        "filterable": getattr(field_info, "index", False) or field_name in ["status", "type", "category"]
-                    }
-                    model_info["fields"].append(field_data)
-            
-            # Identify primary key field
-            primary_key_fields = [f for f in model_info["fields"] if f["primary_key"]]
-            model_info["primary_key"] = primary_key_fields[0]["name"] if primary_key_fields else "id"
-            
-            models_metadata.append(model_info)
-        
-        return models_metadata
+        """
+        Extract metadata from model classes for service generation.
+
+        Metadata is cached per class and shared between calls, so callers
+        must treat the returned dicts as read-only.
+        """
+        return [_model_metadata(model_class) for model_class in model_classes]
 
     def generate_full_service(
         self,
@@ -209,28 +484,46 @@ class SmartServiceTemplates(SmartTemplates):
             )
             return {}, RenderError(error=error)
 
+        # Fragments are reused within one run only, so a shared instance never
+        # hands one project's output to the next
+        if self.env.fragment_cache is not None:
+            self.env.fragment_cache.clear()
+
         try:
             # Extract model metadata
             models_metadata = self._extract_model_metadata(model_classes)
             
             # Prepare project structure
             project_dir = self.output_dir / config.project_name
-            generated_files = {}
+            # Every stage adds its files here directly
+            generated_files: dict[str, str] = {}
             
             # Base context for all generation
             base_context = {
+                # One generation timestamp for every file in the service
+                "timestamp": datetime.now(),
                 "config": config.model_dump(),
                 "models": models_metadata,
                 "project_name": config.project_name,
                 "model_count": len(model_classes),
+                # Configured and not known to be broken; decided without
+                # building any engine
+                "fastapi_available": config.generate_fastapi
+                and self._component_available("fastapi_templates"),
+                "pytest_available": config.generate_tests
+                and self._component_available("pytest_templates"),
+                "database_available": config.generate_database
+                and self._component_available("database_templates"),
             }
             
             # CRITICAL: Defensive copy through _prepare_service_context
             service_context = self._prepare_service_context(base_context)
             
-            # Generate database schema
-            if config.generate_database and self.database_templates:
-                schema_content, db_error = self.database_templates.generate_create_table_sql(
+            # Generate database schema; the only engine used directly, so the
+            # only one built, and only when configured
+            db_engine = self.database_templates if config.generate_database else None
+            if db_engine:
+                schema_content, db_error = db_engine.generate_create_table_sql(
                     model_classes,
                     output_file=None  # We'll handle file writing
                 )
@@ -247,7 +540,7 @@ class SmartServiceTemplates(SmartTemplates):
                     # Create sample instances for test data
                     sample_instances = self._create_sample_instances(model_classes)
                     if sample_instances:
-                        insert_content, insert_error = self.database_templates.generate_insert_sql(
+                        insert_content, insert_error = db_engine.generate_insert_sql(
                             sample_instances,
                             output_file=None
                         )
@@ -256,38 +549,32 @@ class SmartServiceTemplates(SmartTemplates):
                             if self._write_output_file(insert_content, test_data_file):
                                 generated_files["database/test_data.sql"] = insert_content
             
-            # Generate FastAPI application
-            if config.generate_fastapi and self.fastapi_templates:
-                fastapi_content, fastapi_error = self._generate_fastapi_app(
-                    models_metadata, service_context, project_dir
+            # Generate FastAPI application (rendered by this engine's own templates)
+            if service_context["fastapi_available"]:
+                fastapi_error = self._generate_fastapi_app(
+                    models_metadata, service_context, project_dir, generated_files
                 )
                 if fastapi_error:
                     self._logger.error(f"FastAPI generation failed: {fastapi_error.error.message}")
                     return generated_files, fastapi_error
-                
-                generated_files.update(fastapi_content)
             
             # Generate tests
-            if config.generate_tests and self.pytest_templates:
-                test_content, test_error = self._generate_tests(
-                    models_metadata, service_context, project_dir
+            if service_context["pytest_available"]:
+                test_error = self._generate_tests(
+                    models_metadata, service_context, project_dir, generated_files
                 )
                 if test_error:
                     self._logger.error(f"Test generation failed: {test_error.error.message}")
                     return generated_files, test_error
-                
-                generated_files.update(test_content)
             
             # Generate project configuration files
-            config_content, config_error = self._generate_project_config(
-                service_context, project_dir
+            config_error = self._generate_project_config(
+                service_context, project_dir, generated_files
             )
             if config_error:
                 self._logger.error(f"Config generation failed: {config_error.error.message}")
                 return generated_files, config_error
             
-            generated_files.update(config_content)
-            
             self._logger.info(f"Generated complete service with {len(generated_files)} files")
             return generated_files, None
 
@@ -309,18 +596,19 @@ class SmartServiceTemplates(SmartTemplates):
         for model_class in model_classes:
             try:
                 # Create minimal instance with required fields
-                if hasattr(model_class, "__fields__"):
+                if _classify_model(model_class)[1]:
                     field_values = {}
-                    for field_name, field_info in model_class.__fields__.items():
+                    for field_name, field_info in model_class.model_fields.items():
                         if field_info.default is None and not getattr(field_info, "nullable", True):
                             # Required field - provide sample value
-                            field_type = str(field_info.annotation).lower()
-                            if "int" in field_type:
-                                field_values[field_name] = 1
-                            elif "str" in field_type:
-                                field_values[field_name] = f"Sample {field_name}"
-                            elif "bool" in field_type:
-                                field_values[field_name] = True
+                            try:
+                                value = _sample_value_for(field_info.annotation, field_name)
+                            except TypeError:  # Unhashable annotation metadata
+                                value = _sample_value_for.__wrapped__(
+                                    field_info.annotation, field_name
+                                )
+                            if value is not None:
+                                field_values[field_name] = value
                     
                     if field_values:  # Only create if we have required fields
                         instance = model_class(**field_values)
@@ -331,48 +619,76 @@ class SmartServiceTemplates(SmartTemplates):
         
         return sample_instances
 
+    def _generate_model_files(
+        self,
+        template_name: str,
+        output_pattern: str,
+        models_metadata: list[dict],
+        context: dict[str, Any],
+        project_dir: Path,
+        out: dict[str, str],
+    ) -> None:
+        """
+        Render and write one file per model into out, skipping models that fail.
+
+        Models are independent, so several are rendered and written on a thread
+        pool, overlapping their file writes. Files are added in model order.
+        """
+
+        def generate(model: dict) -> tuple[str, str] | None:
+            content, error = self._render_template(template_name, context, model=model)
+            if error:
+                return None
+            output_name = output_pattern.format(table_name=model["table_name"])
+            if not self._write_output_file(content, project_dir / output_name):
+                return None
+            return output_name, content
+
+        if len(models_metadata) > 1:
+            with ThreadPoolExecutor() as pool:
+                results = list(pool.map(generate, models_metadata))
+        else:
+            results = [generate(model) for model in models_metadata]
+        out.update(result for result in results if result is not None)
+
     def _generate_fastapi_app(
         self, 
         models_metadata: list[dict], 
         context: dict[str, Any], 
-        project_dir: Path
-    ) -> tuple[dict[str, str], RenderError | None]:
-        """Generate FastAPI application files."""
-        generated_files = {}
-        
+        project_dir: Path,
+        out: dict[str, str],
+    ) -> RenderError | None:
+        """Generate FastAPI application files, adding them to out."""
         try:
             # Main FastAPI app
-            app_context = context.copy()
-            app_context["models"] = models_metadata
-            
-            app_content, error = self.render_safe("fastapi/main.py.j2", app_context)
+            app_content, error = self._render_template(
+                "fastapi/main.py.j2", context, models=models_metadata
+            )
             if error:
-                return {}, error
+                return error
             
             app_file = project_dir / "app" / "main.py"
             if self._write_output_file(app_content, app_file):
-                generated_files["app/main.py"] = app_content
+                out["app/main.py"] = app_content
             
             # Generate CRUD routes for each model
-            for model in models_metadata:
-                route_context = context.copy()
-                route_context["model"] = model
-                
-                route_content, route_error = self.render_safe("fastapi/crud_routes.py.j2", route_context)
-                if not route_error:
-                    route_file = project_dir / "app" / "routes" / f"{model['table_name']}.py"
-                    if self._write_output_file(route_content, route_file):
-                        generated_files[f"app/routes/{model['table_name']}.py"] = route_content
+            self._generate_model_files(
+                "fastapi/crud_routes.py.j2",
+                "app/routes/{table_name}.py",
+                models_metadata,
+                context,
+                project_dir,
+                out,
+            )
             
             # Database connection
-            db_context = context.copy()
-            db_content, db_error = self.render_safe("fastapi/database.py.j2", db_context)
+            db_content, db_error = self._render_template("fastapi/database.py.j2", context)
             if not db_error:
                 db_file = project_dir / "app" / "database.py"
                 if self._write_output_file(db_content, db_file):
-                    generated_files["app/database.py"] = db_content
+                    out["app/database.py"] = db_content
             
-            return generated_files, None
+            return None
             
         except Exception as e:
             error = TemplateErrorDetail(
@@ -380,42 +696,39 @@ class SmartServiceTemplates(SmartTemplates):
                 message=f"FastAPI generation error: {e}",
                 context_data={"model_count": len(models_metadata)},
             )
-            return generated_files, RenderError(error=error)
+            return RenderError(error=error)
 
     def _generate_tests(
         self, 
         models_metadata: list[dict], 
         context: dict[str, Any], 
-        project_dir: Path
-    ) -> tuple[dict[str, str], RenderError | None]:
-        """Generate test files."""
-        generated_files = {}
-        
+        project_dir: Path,
+        out: dict[str, str],
+    ) -> RenderError | None:
+        """Generate test files, adding them to out."""
         try:
             # Test configuration
-            test_context = context.copy()
-            test_context["models"] = models_metadata
-            
-            conftest_content, error = self.render_safe("tests/conftest.py.j2", test_context)
+            conftest_content, error = self._render_template(
+                "tests/conftest.py.j2", context, models=models_metadata
+            )
             if error:
-                return {}, error
+                return error
             
             conftest_file = project_dir / "tests" / "conftest.py"
             if self._write_output_file(conftest_content, conftest_file):
-                generated_files["tests/conftest.py"] = conftest_content
+                out["tests/conftest.py"] = conftest_content
             
             # Generate tests for each model
-            for model in models_metadata:
-                model_test_context = context.copy()
-                model_test_context["model"] = model
-                
-                test_content, test_error = self.render_safe("tests/test_crud.py.j2", model_test_context)
-                if not test_error:
-                    test_file = project_dir / "tests" / f"test_{model['table_name']}.py"
-                    if self._write_output_file(test_content, test_file):
-                        generated_files[f"tests/test_{model['table_name']}.py"] = test_content
+            self._generate_model_files(
+                "tests/test_crud.py.j2",
+                "tests/test_{table_name}.py",
+                models_metadata,
+                context,
+                project_dir,
+                out,
+            )
             
-            return generated_files, None
+            return None
             
         except Exception as e:
             error = TemplateErrorDetail(
@@ -423,35 +736,26 @@ class SmartServiceTemplates(SmartTemplates):
                 message=f"Test generation error: {e}",
                 context_data={"model_count": len(models_metadata)},
             )
-            return generated_files, RenderError(error=error)
+            return RenderError(error=error)
 
     def _generate_project_config(
         self, 
         context: dict[str, Any], 
-        project_dir: Path
-    ) -> tuple[dict[str, str], RenderError | None]:
-        """Generate project configuration files."""
-        generated_files = {}
-        
+        project_dir: Path,
+        out: dict[str, str],
+    ) -> RenderError | None:
+        """Generate project configuration files, adding them to out."""
         try:
-            config_files = [
-                ("pyproject.toml.j2", "pyproject.toml"),
-                ("requirements.txt.j2", "requirements.txt"),
-                ("README.md.j2", "README.md"),
-                ("docker/Dockerfile.j2", "Dockerfile"),
-                (".env.template.j2", ".env.template"),
-            ]
-            
-            for template_name, output_name in config_files:
-                content, error = self.render_safe(template_name, context)
+            for template_name, output_name in self._CONFIG_TEMPLATES:
+                content, error = self._render_template(template_name, context)
                 if not error:
                     output_file = project_dir / output_name
                     if self._write_output_file(content, output_file):
-                        generated_files[output_name] = content
+                        out[output_name] = content
                 else:
                     self._logger.warning(f"Could not generate {output_name}: {error.error.message}")
             
-            return generated_files, None
+            return None
             
         except Exception as e:
             error = TemplateErrorDetail(
@@ -459,7 +763,7 @@ class SmartServiceTemplates(SmartTemplates):
                 message=f"Config generation error: {e}",
                 context_data={"context_keys": list(context.keys())},
             )
-            return generated_files, RenderError(error=error)
+            return RenderError(error=error)
 
     def generate_api_documentation(
         self,
@@ -517,12 +821,27 @@ class SmartServiceTemplates(SmartTemplates):
             return "", RenderError(error=error)
 
 
+@lru_cache(maxsize=None)
+def get_service_templates(
+    directory: str, output_dir: str = "generated_services", debug_mode: bool = False
+) -> SmartServiceTemplates:
+    """
+    Return a shared SmartServiceTemplates instance for the given settings.
+
+    Recommended entry point for pipelines that generate services repeatedly:
+    the environment, sub-engines and compiled-template caches are built once
+    per process instead of once per call. Construct SmartServiceTemplates
+    directly for an isolated instance (e.g. in tests).
+    """
+    return SmartServiceTemplates(directory, output_dir=output_dir, debug_mode=debug_mode)
+
+
 # Usage examples:
 #
 # # Generate complete CRUD service
 # from tests.models.business_objects import School, Course, Student, Enrollment
 # 
-# service_templates = SmartServiceTemplates("service_templates/")
+# service_templates = get_service_templates("service_templates/")
 # 
 # config = ServiceGenerationConfig(
 #     project_name="education_api",
@@ -7,8 +7,14 @@ endpoints for testing all SmartTemplates FastAPI features.
 
 from __future__ import annotations
 
+import json
+import os
+from typing import Any
+
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import Response
+from jinja2 import FileSystemBytecodeCache
+from pydantic_core import to_json
 
 from smart_templates.fastapi_integration import SmartFastApiTemplates, create_smart_response
 from university.models.business_objects import (
@@ -23,10 +29,14 @@ from university.models.business_objects import (
 )
 
 # Initialize templates
+# Debug mode (template auto-reload, detailed error pages) is opt-in for development
+DEBUG_MODE = os.environ.get("SMART_TEMPLATES_DEBUG", "").lower() in ("1", "true", "yes")
+
 templates = SmartFastApiTemplates(
     "tests/fixtures/templates",
-    debug_mode=True,
-    api_path_prefix="/api/"
+    debug_mode=DEBUG_MODE,
+    api_path_prefix="/api/",
+    bytecode_cache=FileSystemBytecodeCache(),
 )
 
 # Register business object templates
@@ -50,37 +60,63 @@ templates.registry.register_simple(
     variation="instructor"
 )
 
+# Compile every page template up front so the first request hits a warm cache
+_PAGE_TEMPLATES = (
+    "school/list.html",
+    "school/dashboard.html",
+    "school/admin_dashboard.html",
+    "student/profile.html",
+    "student/active.html",
+    "student/completed.html",
+    "course/detail.html",
+    "course/instructor_view.html",
+    "course/student_view.html",
+    "error.html",
+)
+for template_name in _PAGE_TEMPLATES:
+    templates.env.get_template(template_name)
+
 # Create decorator
 smart_response = create_smart_response(templates)
 
 # Initialize app
 app = FastAPI(title="SmartTemplates Test API", version="1.0.0")
 
-# Sample data
+# Sample data (IDs are assigned by the factory)
 schools, courses, students, enrollments = create_complete_test_data()
 
-# Assign IDs to objects for testing
-for i, school in enumerate(schools, 1):
-    school.id = i
+# Index objects by ID so route lookups are a single dict probe
+schools_by_id = {s.id: s for s in schools}
+courses_by_id = {c.id: c for c in courses}
+students_by_id = {s.id: s for s in students}
+# Built in reverse so each course keeps its first enrollment, as a scan would find
+enrollments_by_course_id = {e.course_id: e for e in reversed(enrollments)}
 
-for i, course in enumerate(courses, 1):
-    course.id = i
+# The sample data never changes, so the JSON API serves bodies encoded once
+school_json_by_id = {s.id: to_json(s.to_template_dict()) for s in schools}
+course_json_by_id = {c.id: to_json(c.to_template_dict()) for c in courses}
+student_json_by_id = {s.id: to_json(s.to_template_dict()) for s in students}
+schools_json = to_json({"schools": [s.to_template_dict() for s in schools]})
+students_json = to_json({"students": [s.to_template_dict() for s in students]})
 
-for i, student in enumerate(students, 1):
-    student.id = i
 
-for i, enrollment in enumerate(enrollments, 1):
-    enrollment.id = i
+# Probe endpoints answer with constant bodies, encoded once
+_ROOT_BODY = json.dumps(
+    {"message": "SmartTemplates Test API", "version": "1.0.0"}, separators=(",", ":")
+).encode()
+_HEALTH_BODY = json.dumps(
+    {"status": "healthy", "service": "smarttemplates-test"}, separators=(",", ":")
+).encode()
 
 
 @app.get("/")
 async def root():
-    return {"message": "SmartTemplates Test API", "version": "1.0.0"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "smarttemplates-test"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # School routes
@@ -95,7 +131,7 @@ async def list_schools(request: Request):
 @smart_response("school/dashboard.html")
 async def get_school(request: Request, school_id: int):
     """Get school by ID - demonstrates object-based template resolution."""
-    school = next((s for s in schools if s.id == school_id), None)
+    school = schools_by_id.get(school_id)
     if not school:
         raise HTTPException(status_code=404, detail="School not found")
     return school
@@ -105,7 +141,7 @@ async def get_school(request: Request, school_id: int):
 @smart_response("school/admin_dashboard.html")
 async def get_school_admin(request: Request, school_id: int):
     """School admin dashboard - demonstrates template variations."""
-    school = next((s for s in schools if s.id == school_id), None)
+    school = schools_by_id.get(school_id)
     if not school:
         raise HTTPException(status_code=404, detail="School not found")
     return school
@@ -113,16 +149,16 @@ async def get_school_admin(request: Request, school_id: int):
 
 # Student routes
 @app.get("/students")
-async def list_students(request: Request):
+async def list_students():
     """List all students - JSON only endpoint."""
-    return {"students": [s.to_template_dict() for s in students]}
+    return Response(content=students_json, media_type="application/json")
 
 
 @app.get("/students/{student_id}")
 @smart_response("student/profile.html")
 async def get_student(request: Request, student_id: int):
     """Get student by ID - demonstrates status-based template variations."""
-    student = next((s for s in students if s.id == student_id), None)
+    student = students_by_id.get(student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
     return student
@@ -132,42 +168,20 @@ async def get_student(request: Request, student_id: int):
 @smart_response("student/active.html")
 async def get_student_active_status(request: Request, student_id: int):
     """Student active status view - demonstrates enrollment status templates."""
-    student = next((s for s in students if s.id == student_id), None)
+    student = students_by_id.get(student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
-    
-    # Use variation to select active template
-    content, error = templates.render_obj(
-        student, 
-        {"request": request},
-        variation=EnrollmentStatus.ACTIVE
-    )
-    
-    if error:
-        raise HTTPException(status_code=500, detail="Template error")
-    
-    return HTMLResponse(content=content)
+    return student
 
 
 @app.get("/students/{student_id}/completed")
 @smart_response("student/completed.html")
 async def get_student_completed_status(request: Request, student_id: int):
     """Student completed status view - demonstrates enrollment status templates."""
-    student = next((s for s in students if s.id == student_id), None)
+    student = students_by_id.get(student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
-    
-    # Use variation to select completed template
-    content, error = templates.render_obj(
-        student, 
-        {"request": request},
-        variation=EnrollmentStatus.COMPLETED
-    )
-    
-    if error:
-        raise HTTPException(status_code=500, detail="Template error")
-    
-    return HTMLResponse(content=content)
+    return student
 
 
 # Course routes
@@ -175,7 +189,7 @@ async def get_student_completed_status(request: Request, student_id: int):
 @smart_response("course/detail.html")
 async def get_course(request: Request, course_id: int):
     """Get course by ID - demonstrates instructor/student view variations."""
-    course = next((c for c in courses if c.id == course_id), None)
+    course = courses_by_id.get(course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
     return course
@@ -185,33 +199,22 @@ async def get_course(request: Request, course_id: int):
 @smart_response("course/instructor_view.html")
 async def get_course_instructor_view(request: Request, course_id: int):
     """Instructor view of course - demonstrates template variations."""
-    course = next((c for c in courses if c.id == course_id), None)
+    course = courses_by_id.get(course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
-    
-    # Use variation to select instructor template
-    content, error = templates.render_obj(
-        course, 
-        {"request": request},
-        variation="instructor"
-    )
-    
-    if error:
-        raise HTTPException(status_code=500, detail="Template error")
-    
-    return HTMLResponse(content=content)
+    return course
 
 
 @app.get("/courses/{course_id}/student")
 @smart_response("course/student_view.html")
 async def get_course_student_view(request: Request, course_id: int):
     """Student view of course - demonstrates template variations."""
-    course = next((c for c in courses if c.id == course_id), None)
+    course = courses_by_id.get(course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
     
     # Find student enrollment for this course
-    enrollment = next((e for e in enrollments if e.course_id == course_id), None)
+    enrollment = enrollments_by_course_id.get(course_id)
     if not enrollment:
         raise HTTPException(status_code=404, detail="Enrollment not found")
     
@@ -222,34 +225,34 @@ async def get_course_student_view(request: Request, course_id: int):
 @app.get("/api/schools")
 async def api_list_schools():
     """API endpoint - should return JSON regardless of Accept header."""
-    return {"schools": [s.to_template_dict() for s in schools]}
+    return Response(content=schools_json, media_type="application/json")
 
 
 @app.get("/api/schools/{school_id}")
 async def api_get_school(school_id: int):
     """API endpoint for school data."""
-    school = next((s for s in schools if s.id == school_id), None)
-    if not school:
+    body = school_json_by_id.get(school_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="School not found")
-    return school.to_template_dict()
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/students/{student_id}")
 async def api_get_student(student_id: int):
     """API endpoint for student data."""
-    student = next((s for s in students if s.id == student_id), None)
-    if not student:
+    body = student_json_by_id.get(student_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Student not found")
-    return student.to_template_dict()
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/courses/{course_id}")
 async def api_get_course(course_id: int):
     """API endpoint for course data."""
-    course = next((c for c in courses if c.id == course_id), None)
-    if not course:
+    body = course_json_by_id.get(course_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Course not found")
-    return course.to_template_dict()
+    return Response(content=body, media_type="application/json")
 
 
 # Error demonstration routes
@@ -278,7 +281,7 @@ async def missing_object_error(request: Request):
 @smart_response("school/dashboard.html") 
 def get_school_sync(request: Request, school_id: int):
     """Sync function with smart_response - tests sync/async compatibility."""
-    school = next((s for s in schools if s.id == school_id), None)
+    school = schools_by_id.get(school_id)
     if not school:
         raise HTTPException(status_code=404, detail="School not found")
     return school
@@ -289,7 +292,18 @@ def get_school_sync(request: Request, school_id: int):
 @smart_response("school/dashboard.html")
 async def content_negotiation_demo(request: Request, school_id: int):
     """Demonstrates content negotiation based on Accept headers."""
-    school = next((s for s in schools if s.id == school_id), None)
+    school = schools_by_id.get(school_id)
     if not school:
         raise HTTPException(status_code=404, detail="School not found")
-    return school
\ No newline at end of file
+    return school
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools ship with uvicorn[standard] via fastapi[standard]
+    uvicorn.run(
+        "university.api.app:app",
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count() or 1,
+    )
@@ -8,12 +8,16 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Request
 from smart_templates.fastapi_integration import SmartFastApiTemplates, create_smart_response
-from university.models.business_objects import School, create_sample_school
-
-router = APIRouter(prefix="/schools", tags=["schools"])
+from university.models.business_objects import (
+    School,
+    create_sample_course,
+    create_sample_school,
+)
 
 def setup_school_routes(templates: SmartFastApiTemplates) -> APIRouter:
     """Setup school routes with template integration."""
+    # A fresh router per setup, so repeated setups never stack duplicate routes
+    router = APIRouter(prefix="/schools", tags=["schools"])
     smart_response = create_smart_response(templates)
     
     # Register school templates
@@ -21,52 +25,60 @@ def setup_school_routes(templates: SmartFastApiTemplates) -> APIRouter:
     templates.registry.register_simple(School, template_name="school/list.html", variation="list")
     templates.registry.register_simple(School, template_name="school/admin_dashboard.html", variation="admin")
     
+    # Sample schools are built once per setup and shared by every request
+    schools = [
+        create_sample_school("Tech University", "San Francisco", "CA"),
+        create_sample_school("State College", "Austin", "TX"),
+        create_sample_school("Community College", "Portland", "OR"),
+    ]
+    for i, school in enumerate(schools, 1):
+        school.id = i
+
+    schools_by_id: dict[int, School] = {}
+    admin_schools_by_id: dict[int, School] = {}
+    for school_id in range(1, 4):
+        school = create_sample_school(f"School {school_id}", "Test City", "CA")
+        school.id = school_id
+        schools_by_id[school_id] = school
+
+        admin_school = create_sample_school(
+            f"Admin View - School {school_id}", "Admin City", "CA"
+        )
+        admin_school.id = school_id
+        # Sample courses for the admin view
+        admin_school.courses.extend([
+            create_sample_course("Computer Science 101", "CS101", admin_school),
+            create_sample_course("Mathematics 201", "MATH201", admin_school),
+            create_sample_course("Physics 301", "PHYS301", admin_school),
+        ])
+        admin_schools_by_id[school_id] = admin_school
+
     @router.get("/")
     @smart_response("school/list.html")
     async def list_schools(request: Request):
         """List all schools with content negotiation."""
-        schools = [
-            create_sample_school("Tech University", "San Francisco", "CA"),
-            create_sample_school("State College", "Austin", "TX"),
-            create_sample_school("Community College", "Portland", "OR"),
-        ]
-        for i, school in enumerate(schools, 1):
-            school.id = i
         return {"schools": schools}
     
     @router.get("/{school_id}")
     @smart_response("school/dashboard.html")
     async def get_school(request: Request, school_id: int):
         """Get school by ID with dashboard view."""
-        if school_id < 1 or school_id > 3:
+        school = schools_by_id.get(school_id)
+        if school is None:
             raise HTTPException(status_code=404, detail="School not found")
-        
-        school = create_sample_school(f"School {school_id}", "Test City", "CA")
-        school.id = school_id
         return school
     
     @router.get("/{school_id}/admin")
     @smart_response("school/admin_dashboard.html")
     async def get_school_admin(request: Request, school_id: int):
         """Get school admin dashboard with administrative controls."""
-        if school_id < 1 or school_id > 3:
+        school = admin_schools_by_id.get(school_id)
+        if school is None:
             raise HTTPException(status_code=404, detail="School not found")
-            
-        school = create_sample_school(f"Admin View - School {school_id}", "Admin City", "CA")
-        school.id = school_id
-        
-        # Add sample courses for admin view
-        from university.models.business_objects import create_sample_course
-        course1 = create_sample_course("Computer Science 101", "CS101", school)
-        course2 = create_sample_course("Mathematics 201", "MATH201", school)
-        course3 = create_sample_course("Physics 301", "PHYS301", school)
-        
-        school.courses.extend([course1, course2, course3])
-        
         return school
     
     @router.post("/")
-    async def create_school(request: Request, school_data: dict):
+    async def create_school(school_data: dict):
         """Create new school (API-only endpoint)."""
         # Simplified creation for testing
         new_school = create_sample_school(
@@ -78,7 +90,7 @@ def setup_school_routes(templates: SmartFastApiTemplates) -> APIRouter:
         return new_school.to_template_dict()
     
     @router.put("/{school_id}")
-    async def update_school(request: Request, school_id: int, school_data: dict):
+    async def update_school(school_id: int, school_data: dict):
         """Update existing school (API-only endpoint)."""
         if school_id < 1:
             raise HTTPException(status_code=404, detail="School not found")
@@ -92,7 +104,7 @@ def setup_school_routes(templates: SmartFastApiTemplates) -> APIRouter:
         return updated_school.to_template_dict()
     
     @router.delete("/{school_id}")
-    async def delete_school(request: Request, school_id: int):
+    async def delete_school(school_id: int):
         """Delete school (API-only endpoint)."""
         if school_id < 1:
             raise HTTPException(status_code=404, detail="School not found")
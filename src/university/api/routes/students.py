@@ -17,87 +17,158 @@ from university.models.business_objects import (
     create_sample_school,
 )
 
-router = APIRouter(prefix="/students", tags=["students"])
+# Student template registrations, applied once per registry
+_STUDENT_TEMPLATES: tuple[tuple[str, EnrollmentStatus | str | None], ...] = (
+    ("student/profile.html", None),
+    ("student/active.html", EnrollmentStatus.ACTIVE),
+    ("student/completed.html", EnrollmentStatus.COMPLETED),
+    ("student/reattempt.html", EnrollmentStatus.REATTEMPT),
+    ("student/transcript.html", "transcript"),
+)
 
-def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
-    """Setup student routes with template integration."""
-    smart_response = create_smart_response(templates)
+_STUDENT_IDS = range(1, 5)
+
+
+def _register_student_templates(templates: SmartFastApiTemplates) -> None:
+    """Register student templates; repeat calls leave the registry unchanged."""
+    for template_name, variation in _STUDENT_TEMPLATES:
+        templates.registry.register_simple(
+            Student, template_name=template_name, variation=variation
+        )
+
+
+def _sample_students() -> list[dict]:
+    """Template dicts for the student list endpoint."""
+    students = [
+        create_sample_student("Alice Johnson", major="Computer Science"),
+        create_sample_student("Bob Smith", major="Mathematics"),
+        create_sample_student("Carol Davis", major="Physics"),
+        create_sample_student("David Wilson", major="Engineering"),
+    ]
+    for i, student in enumerate(students, 1):
+        student.id = i
+    return [s.to_template_dict() for s in students]
+
+
+def _profile_student(student_id: int) -> Student:
+    """Student with sample enrollments for the profile view."""
+    student = create_sample_student(f"Student {student_id}", major="Computer Science")
+    student.id = student_id
+    
+    # Add sample enrollments for demonstration
+    school = create_sample_school("Sample University")
+    course1 = create_sample_course("Python Programming", "CS101", school)
+    course2 = create_sample_course("Data Structures", "CS201", school)
+    
+    enrollment1 = create_sample_enrollment(student, course1, EnrollmentStatus.ACTIVE, 75.0)
+    enrollment2 = create_sample_enrollment(student, course2, EnrollmentStatus.COMPLETED, 95.0)
+    
+    student.enrollments.extend([enrollment1, enrollment2])
+    return student
+
+
+def _status_student(
+    student_id: int,
+    name: str,
+    school_name: str,
+    course: tuple[str, str],
+    status: EnrollmentStatus,
+    progress: float,
+) -> Student:
+    """Student with a single enrollment in the given status."""
+    student = create_sample_student(f"{name} {student_id}", major="Computer Science")
+    student.id = student_id
     
-    # Register student templates with status variations
-    templates.registry.register_simple(Student, template_name="student/profile.html")
-    templates.registry.register_simple(
-        Student,
-        template_name="student/active.html",
-        variation=EnrollmentStatus.ACTIVE
+    school = create_sample_school(school_name)
+    enrollment = create_sample_enrollment(
+        student, create_sample_course(*course, school), status, progress
     )
-    templates.registry.register_simple(
-        Student,
-        template_name="student/completed.html",
-        variation=EnrollmentStatus.COMPLETED
+    student.enrollments.append(enrollment)
+    return student
+
+
+def _transcript_student(student_id: int) -> Student:
+    """Student with a full enrollment history for the transcript view."""
+    student = create_sample_student(f"Transcript Student {student_id}", major="Computer Science")
+    student.id = student_id
+    
+    # Create comprehensive enrollment history
+    school = create_sample_school("Transcript University")
+    
+    courses = [
+        create_sample_course("Intro to Programming", "CS101", school),
+        create_sample_course("Data Structures", "CS201", school),
+        create_sample_course("Algorithms", "CS301", school),
+        create_sample_course("Database Systems", "CS401", school),
+    ]
+    
+    enrollments = [
+        create_sample_enrollment(student, courses[0], EnrollmentStatus.COMPLETED, 85.0),
+        create_sample_enrollment(student, courses[1], EnrollmentStatus.COMPLETED, 92.0),
+        create_sample_enrollment(student, courses[2], EnrollmentStatus.ACTIVE, 78.0),
+        create_sample_enrollment(student, courses[3], EnrollmentStatus.REATTEMPT, 45.0),
+    ]
+    
+    student.enrollments.extend(enrollments)
+    return student
+
+
+# Sample fixtures are built once at import and shared by every request
+_SAMPLE_STUDENTS_DICT = {"students": _sample_students()}
+_PROFILE_STUDENTS = {i: _profile_student(i) for i in _STUDENT_IDS}
+_ACTIVE_STUDENTS = {
+    i: _status_student(
+        i, "Active Student", "Active University", ("Current Course", "ACT101"),
+        EnrollmentStatus.ACTIVE, 60.0,
     )
-    templates.registry.register_simple(
-        Student,
-        template_name="student/reattempt.html",
-        variation=EnrollmentStatus.REATTEMPT
+    for i in _STUDENT_IDS
+}
+_COMPLETED_STUDENTS = {
+    i: _status_student(
+        i, "Graduate", "Graduate University", ("Completed Course", "GRAD101"),
+        EnrollmentStatus.COMPLETED, 90.0,
     )
-    templates.registry.register_simple(
-        Student,
-        template_name="student/transcript.html",
-        variation="transcript"
+    for i in _STUDENT_IDS
+}
+_REATTEMPT_STUDENTS = {
+    i: _status_student(
+        i, "Reattempt Student", "Support University", ("Challenging Course", "HARD101"),
+        EnrollmentStatus.REATTEMPT, 35.0,
     )
+    for i in _STUDENT_IDS
+}
+_TRANSCRIPT_STUDENTS = {i: _transcript_student(i) for i in _STUDENT_IDS}
+
+
+def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
+    """Setup student routes with template integration."""
+    # A fresh router per setup, so repeated setups never stack duplicate routes
+    router = APIRouter(prefix="/students", tags=["students"])
+    smart_response = create_smart_response(templates)
+    _register_student_templates(templates)
     
     @router.get("/")
-    async def list_students(request: Request):
+    async def list_students():
         """List all students - JSON endpoint."""
-        students = [
-            create_sample_student("Alice Johnson", major="Computer Science"),
-            create_sample_student("Bob Smith", major="Mathematics"),
-            create_sample_student("Carol Davis", major="Physics"),
-            create_sample_student("David Wilson", major="Engineering"),
-        ]
-        for i, student in enumerate(students, 1):
-            student.id = i
-        
-        return {"students": [s.to_template_dict() for s in students]}
+        return _SAMPLE_STUDENTS_DICT
     
     @router.get("/{student_id}")
     @smart_response("student/profile.html")
     async def get_student(request: Request, student_id: int):
         """Get student profile with basic information."""
-        if student_id < 1 or student_id > 4:
+        student = _PROFILE_STUDENTS.get(student_id)
+        if student is None:
             raise HTTPException(status_code=404, detail="Student not found")
-        
-        student = create_sample_student(f"Student {student_id}", major="Computer Science")
-        student.id = student_id
-        
-        # Add sample enrollments for demonstration
-        school = create_sample_school("Sample University")
-        course1 = create_sample_course("Python Programming", "CS101", school)
-        course2 = create_sample_course("Data Structures", "CS201", school)
-        
-        enrollment1 = create_sample_enrollment(student, course1, EnrollmentStatus.ACTIVE, 75.0)
-        enrollment2 = create_sample_enrollment(student, course2, EnrollmentStatus.COMPLETED, 95.0)
-        
-        student.enrollments.extend([enrollment1, enrollment2])
-        
         return student
     
     @router.get("/{student_id}/active")
     @smart_response("student/active.html", error_template="error.html")
     async def get_active_student(request: Request, student_id: int):
         """Get student with active enrollment status view."""
-        if student_id < 1 or student_id > 4:
+        student = _ACTIVE_STUDENTS.get(student_id)
+        if student is None:
             raise HTTPException(status_code=404, detail="Student not found")
         
-        student = create_sample_student(f"Active Student {student_id}", major="Computer Science")
-        student.id = student_id
-        
-        # Create active enrollments
-        school = create_sample_school("Active University")
-        course = create_sample_course("Current Course", "ACT101", school)
-        enrollment = create_sample_enrollment(student, course, EnrollmentStatus.ACTIVE, 60.0)
-        student.enrollments.append(enrollment)
-        
         # Use status variation for template selection
         content, error = templates.render_obj(
             student,
@@ -115,18 +186,10 @@ def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
     @smart_response("student/completed.html")
     async def get_completed_student(request: Request, student_id: int):
         """Get student with completed enrollment status view."""
-        if student_id < 1 or student_id > 4:
+        student = _COMPLETED_STUDENTS.get(student_id)
+        if student is None:
             raise HTTPException(status_code=404, detail="Student not found")
         
-        student = create_sample_student(f"Graduate {student_id}", major="Computer Science")
-        student.id = student_id
-        
-        # Create completed enrollments
-        school = create_sample_school("Graduate University")
-        course = create_sample_course("Completed Course", "GRAD101", school)
-        enrollment = create_sample_enrollment(student, course, EnrollmentStatus.COMPLETED, 90.0)
-        student.enrollments.append(enrollment)
-        
         # Use status variation for template selection
         content, error = templates.render_obj(
             student,
@@ -144,18 +207,10 @@ def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
     @smart_response("student/reattempt.html")
     async def get_reattempt_student(request: Request, student_id: int):
         """Get student with reattempt enrollment status view."""
-        if student_id < 1 or student_id > 4:
+        student = _REATTEMPT_STUDENTS.get(student_id)
+        if student is None:
             raise HTTPException(status_code=404, detail="Student not found")
         
-        student = create_sample_student(f"Reattempt Student {student_id}", major="Computer Science")
-        student.id = student_id
-        
-        # Create reattempt enrollments
-        school = create_sample_school("Support University")
-        course = create_sample_course("Challenging Course", "HARD101", school)
-        enrollment = create_sample_enrollment(student, course, EnrollmentStatus.REATTEMPT, 35.0)
-        student.enrollments.append(enrollment)
-        
         # Use status variation for template selection
         content, error = templates.render_obj(
             student,
@@ -173,35 +228,14 @@ def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
     @smart_response("student/transcript.html")
     async def get_student_transcript(request: Request, student_id: int):
         """Get student transcript with full enrollment history."""
-        if student_id < 1 or student_id > 4:
+        student = _TRANSCRIPT_STUDENTS.get(student_id)
+        if student is None:
             raise HTTPException(status_code=404, detail="Student not found")
         
-        student = create_sample_student(f"Transcript Student {student_id}", major="Computer Science")
-        student.id = student_id
-        
-        # Create comprehensive enrollment history
-        school = create_sample_school("Transcript University")
-        
-        courses = [
-            create_sample_course("Intro to Programming", "CS101", school),
-            create_sample_course("Data Structures", "CS201", school),
-            create_sample_course("Algorithms", "CS301", school),
-            create_sample_course("Database Systems", "CS401", school),
-        ]
-        
-        enrollments = [
-            create_sample_enrollment(student, courses[0], EnrollmentStatus.COMPLETED, 85.0),
-            create_sample_enrollment(student, courses[1], EnrollmentStatus.COMPLETED, 92.0),
-            create_sample_enrollment(student, courses[2], EnrollmentStatus.ACTIVE, 78.0),
-            create_sample_enrollment(student, courses[3], EnrollmentStatus.REATTEMPT, 45.0),
-        ]
-        
-        student.enrollments.extend(enrollments)
-        
         return student
     
     @router.post("/")
-    async def create_student(request: Request, student_data: dict):
+    async def create_student(student_data: dict):
         """Create new student (API-only endpoint)."""
         new_student = create_sample_student(
             student_data.get("name", "New Student"),
@@ -212,7 +246,7 @@ def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
         return new_student.to_template_dict()
     
     @router.put("/{student_id}")
-    async def update_student(request: Request, student_id: int, student_data: dict):
+    async def update_student(student_id: int, student_data: dict):
         """Update existing student (API-only endpoint)."""
         if student_id < 1:
             raise HTTPException(status_code=404, detail="Student not found")
@@ -226,7 +260,7 @@ def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
         return updated_student.to_template_dict()
     
     @router.delete("/{student_id}")
-    async def delete_student(request: Request, student_id: int):
+    async def delete_student(student_id: int):
         """Delete student (API-only endpoint)."""
         if student_id < 1:
             raise HTTPException(status_code=404, detail="Student not found")
@@ -234,7 +268,7 @@ def setup_student_routes(templates: SmartFastApiTemplates) -> APIRouter:
         return {"message": f"Student {student_id} deleted successfully"}
     
     @router.get("/{student_id}/enrollments")
-    async def get_student_enrollments(request: Request, student_id: int):
+    async def get_student_enrollments(student_id: int):
         """Get student enrollments (API-only endpoint)."""
         if student_id < 1 or student_id > 4:
             raise HTTPException(status_code=404, detail="Student not found")
@@ -389,7 +389,11 @@ def create_sample_enrollment(
 def create_complete_test_data() -> (
     tuple[list[School], list[Course], list[Student], list[Enrollment]]
 ):
-    """Create comprehensive test data with relationships."""
+    """Create comprehensive test data with relationships.
+
+    Objects get sequential IDs (starting at 1 per type) and matching foreign
+    keys as they are created, so the in-memory graph can be indexed by ID.
+    """
 
     # Create schools
     schools = [
@@ -409,6 +413,7 @@ def create_complete_test_data() -> (
     ]
 
     for i, school in enumerate(schools):
+        school.id = i + 1
         school_suffix = str(i + 1)  # A simple way to get a unique suffix per school
         for j, (title, base_code) in enumerate(
             course_name_data[:3]
@@ -416,6 +421,8 @@ def create_complete_test_data() -> (
             # FIX: Changed course_code generation for uniqueness across schools
             course_code = f"{base_code}-{school_suffix}-{j+1}"
             course = create_sample_course(title, course_code, school)
+            course.id = len(courses) + 1
+            course.school_id = school.id
             courses.append(course)
             # FIX: Manually append course to school's courses list for in-memory graph
             school.courses.append(course)
@@ -433,8 +440,9 @@ def create_complete_test_data() -> (
     ]
 
     students = []
-    for name, major in student_data:
+    for student_id, (name, major) in enumerate(student_data, 1):
         student = create_sample_student(name, major=major)
+        student.id = student_id
         students.append(student)
 
     # Create enrollments (realistic distribution)
@@ -467,6 +475,9 @@ def create_complete_test_data() -> (
             status, progress = enrollment_scenarios[scenario_idx]
 
             enrollment = create_sample_enrollment(student, course, status, progress)
+            enrollment.id = len(enrollments) + 1
+            enrollment.student_id = student.id
+            enrollment.course_id = course.id
             enrollments.append(enrollment)
 
             # FIX: Manually append enrollment to both student's and course's enrollment lists
@@ -249,6 +249,19 @@ class TestSmartTemplateRegistryNewFeatures:
         assert mapping1 == mapping2
         assert debug2["cache_info"]["hits"] > debug1["cache_info"]["hits"]
 
+    def test_identical_reregistration_keeps_cache(self):
+        """Test registering the same config again leaves the lookup cache intact."""
+        registry = SmartTemplateRegistry()
+        registry.register_simple(School, template_name="school/dashboard.html")
+        school = create_sample_school("Reload University")
+        registry.find_template(school)
+
+        registry.register_simple(School, template_name="school/dashboard.html")
+
+        assert registry.debug_lookup(school)["cache_info"]["hits"] > 0
+        registry.register_simple(School, template_name="school/list.html")
+        assert registry.find_template(school)["path"] == "school/list.html"
+
     def test_registry_repr(self):
         """Test registry string representation."""
         registry = SmartTemplateRegistry()
@@ -793,6 +806,28 @@ class TestSmartTemplatesDebugFeatures:
         assert types_dict["bool_var"] == "bool(True)"
         assert "_private_var" not in types_dict
 
+    def test_extract_context_types_max_keys(self, smart_templates: SmartTemplates):
+        """Test context type extraction can be capped for huge contexts."""
+        context = {f"var_{i}": i for i in range(10)}
+
+        types_dict = smart_templates._extract_context_types(context, max_keys=3)
+
+        assert list(types_dict) == ["var_0", "var_1", "var_2", "<truncated>"]
+        assert types_dict["<truncated>"] == "10 keys"
+        assert smart_templates._extract_context_types(context, max_keys=10) == (
+            smart_templates._extract_context_types(context)
+        )
+
+    def test_extract_context_types_max_keys_skips_private(
+        self, smart_templates: SmartTemplates
+    ):
+        """Test private keys do not make a fully described context look truncated."""
+        context = {"a": 1, "_private": 2, "b": 3}
+
+        types_dict = smart_templates._extract_context_types(context, max_keys=2)
+
+        assert types_dict == {"a": "int(1)", "b": "int(3)"}
+
     def test_error_detail_timestamp(self):
         """Test that error details include timestamps."""
         before_error = datetime.now()
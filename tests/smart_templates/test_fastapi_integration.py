@@ -28,7 +28,12 @@ from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
 from smart_templates.core import RenderError, SmartTemplateRegistry, TemplateErrorDetail
-from smart_templates.fastapi_integration import SmartFastApiTemplates, create_smart_response
+from smart_templates.fastapi_integration import (
+    SmartFastApiTemplates,
+    SmartTemplateConfig,
+    create_smart_response,
+    create_smart_templates_dependency,
+)
 from university.models.business_objects import (
     Course,
     EnrollmentStatus,
@@ -85,6 +90,21 @@ class TestSmartFastApiTemplatesContentNegotiation:
         
         assert smart_fastapi_templates.wants_json_response(mock_request) is False
 
+    def test_wants_json_response_media_ranges(self, smart_fastapi_templates: SmartFastApiTemplates):
+        """Test Accept header media ranges with parameters and wildcards."""
+        mock_request = Mock()
+        mock_request.url.path = "/users/1"
+
+        mock_request.headers = {"accept": "text/html;q=0.9, Application/JSON;q=0.8"}
+        assert smart_fastapi_templates.wants_json_response(mock_request) is True
+
+        mock_request.headers = {"accept": "*/*"}
+        assert smart_fastapi_templates.wants_json_response(mock_request) is True
+
+        # Browsers append */* as a low-priority fallback; that must stay HTML
+        mock_request.headers = {"accept": "text/html,application/xhtml+xml,*/*;q=0.8"}
+        assert smart_fastapi_templates.wants_json_response(mock_request) is False
+
     def test_prepare_context_basemodel(self, smart_fastapi_templates: SmartFastApiTemplates):
         """Test context preparation with BaseModel having to_template_dict method."""
         school = create_sample_school("Context Test University")
@@ -168,6 +188,28 @@ class TestSmartFastApiTemplatesErrorHandling:
         assert error.error.error_type == "TemplateNotFound"
         assert "nonexistent/student.html" in error.error.message
 
+    def test_fallback_error_html(self, smart_fastapi_templates: SmartFastApiTemplates):
+        """Test the last-resort error page escapes details and hides them in production."""
+        error = RenderError(error=TemplateErrorDetail(
+            error_type="TestError",
+            message="<script>alert(1)</script>",
+            template_name="broken.html",
+            macro_name="render_card",
+        ))
+
+        html = smart_fastapi_templates.create_fallback_error_html(error)
+        assert "TestError" in html
+        assert "broken.html" in html
+        assert "render_card" in html
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+
+        smart_fastapi_templates.set_debug_mode(False)
+        html = smart_fastapi_templates.create_fallback_error_html(error, "secret")
+        assert "TestError" not in html
+        assert "secret" not in html
+        assert "An error occurred while processing your request." in html
+
     def test_debug_mode_toggle(self, smart_fastapi_templates: SmartFastApiTemplates):
         """Test debug mode functionality."""
         smart_fastapi_templates.set_debug_mode(True)
@@ -221,6 +263,60 @@ class TestSmartResponseDecorator:
         assert documented_route.__name__ == "documented_route"
         assert "documented route function" in documented_route.__doc__
 
+    def test_decorator_serializes_basemodel_json(self, smart_fastapi_templates: SmartFastApiTemplates):
+        """Test BaseModel results are serialized by pydantic for JSON requests."""
+        smart_response = create_smart_response(smart_fastapi_templates)
+        app = FastAPI()
+
+        @app.get("/model")
+        @smart_response("student/profile.html")
+        async def model_route(request: Request):
+            return TestDataModel(id=7, name="Model", value="json")
+
+        client = TestClient(app)
+        response = client.get("/model", headers={"Accept": "application/json"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"id": 7, "name": "Model", "value": "json"}
+
+    def test_decorator_leaves_shared_dict_untouched(self, smart_fastapi_templates: SmartFastApiTemplates):
+        """Test an HTML render does not leak request/framework keys into a shared dict."""
+        smart_response = create_smart_response(smart_fastapi_templates)
+        app = FastAPI()
+        shared = {"title": "Shared Page"}
+
+        @app.get("/shared")
+        @smart_response("base.html")
+        async def shared_route(request: Request):
+            return shared
+
+        client = TestClient(app)
+        html_response = client.get("/shared", headers={"Accept": "text/html"})
+        json_response = client.get("/shared", headers={"Accept": "application/json"})
+
+        assert html_response.status_code == 200
+        assert json_response.status_code == 200
+        assert json_response.json() == {"title": "Shared Page"}
+        assert shared == {"title": "Shared Page"}
+
+    def test_decorator_production_json_error_is_generic(self, smart_fastapi_templates: SmartFastApiTemplates):
+        """Test unhandled route errors return a generic JSON 500 outside debug mode."""
+        smart_fastapi_templates.set_debug_mode(False)
+        smart_response = create_smart_response(smart_fastapi_templates)
+        app = FastAPI()
+
+        @app.get("/boom")
+        @smart_response("student/profile.html")
+        async def failing_route(request: Request):
+            raise ValueError("secret detail")
+
+        client = TestClient(app)
+        response = client.get("/boom", headers={"Accept": "application/json"})
+
+        assert response.status_code == 500
+        assert response.json() == {"error": "Internal Server Error"}
+
 
 class TestBusinessScenarios:
     """Test real-world business scenarios with FastAPI integration."""
@@ -495,4 +591,15 @@ class TestPerformanceAndCaching:
         # Verify auto-reload is configured
         assert templates.debug_mode is True
         # Note: Testing actual file reloading would require file system operations
-        # This test just verifies the configuration is set correctly
\ No newline at end of file
+        # This test just verifies the configuration is set correctly
+
+    def test_templates_dependency_returns_singleton(self, templates_dir):
+        """Test the templates dependency builds one shared instance."""
+        config = SmartTemplateConfig(str(templates_dir), debug_mode=True)
+        get_templates = create_smart_templates_dependency(config)
+
+        first = get_templates()
+        second = get_templates()
+
+        assert first is second
+        assert first.debug_mode is True
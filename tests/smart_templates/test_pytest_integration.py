@@ -0,0 +1,666 @@
+"""
+Test cases for SmartTemplates pytest integration.
+
+This module tests the pytest-specific functionality:
+- SmartPytestTemplates: Test report, fixture and test case generation
+- Template compilation caching and output file handling
+
+Test Categories:
+- Configuration: Environment and cache setup
+- Generation: generate_* methods and their template contexts
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from datetime import datetime
+from decimal import Decimal
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from smart_templates import pytest_integration
+from smart_templates.pytest_integration import (
+    InMemoryWriter,
+    SmartPytestTemplates,
+    get_pytest_templates,
+)
+
+
+@pytest.fixture
+def pytest_templates_dir(templates_dir: Path) -> Path:
+    """Template directory extended with pytest generation templates."""
+    (templates_dir / "test_report.html").write_text(
+        "{{ report_type }}: {{ passed_tests }}/{{ total_tests }} passed, "
+        "{{ failed_tests }} failed"
+    )
+    # Output large enough to be worth memoizing
+    (templates_dir / "padded.txt").write_text(
+        "{{ passed_tests }}/{{ total_tests }} passed{{ pad }}"
+    )
+    return templates_dir
+
+
+class TestSmartPytestTemplatesConfiguration:
+    """Test SmartPytestTemplates environment configuration."""
+
+    def test_bytecode_cache_dir(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test compiled templates are cached in the given directory."""
+        output_dir = tmp_path / "reports"
+        cache_dir = tmp_path / "bytecode"
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir),
+            output_dir=str(output_dir),
+            bytecode_cache_dir=str(cache_dir),
+        )
+
+        content, error = templates.generate_test_report({"tests": []})
+
+        assert error is None
+        assert any(cache_dir.glob("*.cache"))
+        assert not any(output_dir.rglob("*.cache"))
+
+        templates.clear_bytecode_cache()
+        assert not any(cache_dir.glob("*.cache"))
+
+    def test_bytecode_cache_shared_across_instances(
+        self, pytest_templates_dir: Path, tmp_path: Path
+    ):
+        """Test a second instance loads bytecode compiled by the first."""
+        build = partial(
+            SmartPytestTemplates,
+            str(pytest_templates_dir),
+            output_dir=str(tmp_path / "reports"),
+            bytecode_cache_dir=str(tmp_path / "bytecode"),
+        )
+        first = build()
+        first.generate_test_report({"tests": []})
+        cached = {p: p.stat().st_mtime_ns for p in (tmp_path / "bytecode").rglob("*.cache")}
+
+        second = build()
+        content, error = second.generate_test_report({"tests": []})
+
+        assert error is None
+        assert content == "test_execution: 0/0 passed, 0 failed"
+        assert cached
+        assert {p: p.stat().st_mtime_ns for p in cached} == cached
+
+    def test_bytecode_cache_off_by_default(
+        self, pytest_templates_dir: Path, tmp_path: Path
+    ):
+        """Test no bytecode cache is written unless a directory is given."""
+        output_dir = tmp_path / "reports"
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir), output_dir=str(output_dir)
+        )
+        templates.generate_test_report({"tests": []})
+
+        assert templates.env.bytecode_cache is None
+        assert not any(output_dir.iterdir())
+        templates.clear_bytecode_cache()  # No-op without a cache
+
+    def test_auto_reload_follows_debug_mode(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test template auto-reload is only enabled in debug mode."""
+        prod = SmartPytestTemplates(str(pytest_templates_dir), output_dir=str(tmp_path / "a"))
+        debug = SmartPytestTemplates(
+            str(pytest_templates_dir), output_dir=str(tmp_path / "b"), debug_mode=True
+        )
+
+        assert prod.env.auto_reload is False
+        assert debug.env.auto_reload is True
+
+    def test_set_debug_mode_reloads_edited_templates(
+        self, templates_dir: Path, tmp_path: Path
+    ):
+        """Test switching to debug mode picks up templates edited since compiling."""
+        (templates_dir / "live.txt").write_text("old")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+        assert templates.generate_test_matrix({}, matrix_template="live.txt")[0] == "old"
+        assert isinstance(templates.env.cache, dict)  # Unbounded
+
+        (templates_dir / "live.txt").write_text("new")
+        os.utime(templates_dir / "live.txt", (0, 2_000_000_000))
+        templates.set_debug_mode(True)
+
+        assert templates.env.auto_reload is True
+        assert templates.generate_test_matrix({}, matrix_template="live.txt")[0] == "new"
+
+    def test_warmup_compiles_default_templates(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test default templates are loaded at construction unless disabled."""
+        (pytest_templates_dir / "test_matrix.py.j2").write_text("{% if %}")  # Broken
+
+        warm = SmartPytestTemplates(str(pytest_templates_dir), output_dir=str(tmp_path / "a"))
+        cold = SmartPytestTemplates(
+            str(pytest_templates_dir), output_dir=str(tmp_path / "b"), warmup=False
+        )
+
+        assert len(warm.env.cache) == 1
+        assert not cold.env.cache
+        _, error = warm.generate_test_matrix({})
+        assert error.error.error_type == "TemplateSyntaxError"
+
+    def test_get_pytest_templates_is_shared(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test the factory returns one instance per distinct configuration."""
+        directory, output_dir = str(pytest_templates_dir), str(tmp_path)
+
+        shared = get_pytest_templates(directory, output_dir)
+
+        assert get_pytest_templates(directory, output_dir) is shared
+        assert get_pytest_templates(directory, output_dir, debug_mode=True) is not shared
+
+
+class TestSmartPytestTemplatesGeneration:
+    """Test generate_* methods and their template contexts."""
+
+    def test_report_counts_statuses(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test report totals are derived from test statuses unless supplied."""
+        templates = SmartPytestTemplates(str(pytest_templates_dir), output_dir=str(tmp_path))
+        tests = [{"status": "passed"}, {"status": "passed"}, {"status": "failed"}, {}]
+
+        derived, _ = templates.generate_test_report({"tests": tests})
+        supplied, _ = templates.generate_test_report({"tests": tests, "passed_tests": 0})
+
+        assert derived == "test_execution: 2/4 passed, 1 failed"
+        assert supplied == "test_execution: 0/4 passed, 1 failed"
+
+    def test_report_does_not_mutate_input(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test generated defaults are layered over, not written into, the input."""
+        templates = SmartPytestTemplates(str(pytest_templates_dir), output_dir=str(tmp_path))
+        results = {"tests": [{"status": "passed"}]}
+
+        content, error = templates.generate_test_report(results)
+
+        assert error is None
+        assert content == "test_execution: 1/1 passed, 0 failed"
+        assert results == {"tests": [{"status": "passed"}]}
+
+    def test_batch_timestamp_shared_across_files(self, templates_dir: Path, tmp_path: Path):
+        """Test a batch timestamp is used for every generated file."""
+        (templates_dir / "stamp.txt").write_text("{{ timestamp.isoformat() }}")
+        stamp = datetime(2024, 1, 2, 3, 4, 5)
+        templates = SmartPytestTemplates(
+            str(templates_dir), output_dir=str(tmp_path), batch_timestamp=stamp
+        )
+
+        report, _ = templates.generate_test_report({"tests": []}, template_name="stamp.txt")
+        matrix, _ = templates.generate_test_matrix({}, matrix_template="stamp.txt")
+
+        assert report == matrix == stamp.isoformat()
+
+    def test_default_timestamp_per_call(
+        self, templates_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test calls without a batch timestamp are stamped when they are made."""
+        (templates_dir / "stamp.txt").write_text("{{ timestamp_ns }}|{{ timestamp }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+        clock = iter([1_000_000_000_000_000_000, 2_000_000_000_000_000_000])
+        monkeypatch.setattr(pytest_integration.time, "time_ns", lambda: next(clock))
+
+        first, _ = templates.generate_test_matrix({}, matrix_template="stamp.txt")
+        second, _ = templates.generate_test_matrix({}, matrix_template="stamp.txt")
+
+        assert first.split("|")[0] == "1000000000000000000"
+        assert second.split("|")[0] == "2000000000000000000"
+        assert templates.batch_timestamp is None
+
+    def test_default_timestamp_shared_within_batch(
+        self, templates_dir: Path, tmp_path: Path
+    ):
+        """Test every job of one generate_batch call carries the same timestamp."""
+        (templates_dir / "a.txt").write_text("{{ timestamp_ns }}")
+        (templates_dir / "b.txt").write_text("{{ timestamp_ns }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        results = templates.generate_batch(
+            [("a.txt", {}, None), ("b.txt", {}, None), ("a.txt", {"n": 1}, None)]
+        )
+
+        assert len({content for content, _ in results}) == 1
+
+    def test_run_defaults_follow_settings(self, templates_dir: Path, tmp_path: Path):
+        """Test shared run defaults pick up timestamp and debug mode changes."""
+        (templates_dir / "run.txt").write_text("{{ timestamp.year }}|{{ debug_mode }}")
+        templates = SmartPytestTemplates(
+            str(templates_dir), output_dir=str(tmp_path), batch_timestamp=datetime(2020, 1, 1)
+        )
+
+        before, _ = templates.generate_test_matrix({}, matrix_template="run.txt")
+        templates.batch_timestamp = datetime(2021, 1, 1)
+        templates.debug_mode = True
+        after, _ = templates.generate_test_matrix({}, matrix_template="run.txt")
+
+        assert (before, after) == ("2020|False", "2021|True")
+
+    def test_timestamp_ns_and_ts_format(self, templates_dir: Path, tmp_path: Path):
+        """Test the nanosecond timestamp matches timestamp and formats lazily."""
+        (templates_dir / "stamp.txt").write_text(
+            "{{ timestamp_ns | ts_format('%Y-%m-%d %H:%M:%S') }}|{{ timestamp }}"
+        )
+        stamp = datetime(2024, 1, 2, 3, 4, 5, 678901)
+        templates = SmartPytestTemplates(
+            str(templates_dir), output_dir=str(tmp_path), batch_timestamp=stamp
+        )
+
+        content, _ = templates.generate_test_matrix({}, matrix_template="stamp.txt")
+
+        assert content == f"2024-01-02 03:04:05|{stamp}"
+
+    def test_render_batch(self, templates_dir: Path, tmp_path: Path):
+        """Test batch rendering returns one result per context, isolating failures."""
+        (templates_dir / "ratio.txt").write_text("{{ total // count }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        results = templates.render_batch(
+            "ratio.txt", [{"total": 6, "count": 2}, {"total": 1, "count": 0}]
+        )
+
+        assert results[0] == ("3", None)
+        assert results[1][0] == ""
+        assert results[1][1].error.error_type == "ZeroDivisionError"
+
+    def test_render_batch_missing_template(self, templates_dir: Path, tmp_path: Path):
+        """Test a missing template yields a structured error for every context."""
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        results = templates.render_batch("missing.txt", [{}, {}])
+
+        assert [error.error.error_type for _, error in results] == [
+            "TemplateNotFound",
+            "TemplateNotFound",
+        ]
+
+    def test_generate_batch(self, templates_dir: Path, tmp_path: Path):
+        """Test batch jobs keep their order, write outputs and isolate failures."""
+        (templates_dir / "a.txt").write_text("a{{ n }}")
+        (templates_dir / "b.txt").write_text("b{{ n }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        results = templates.generate_batch(
+            [
+                ("a.txt", {"n": 1}, "out/a1.txt"),
+                ("b.txt", {"n": 2}, None),
+                ("missing.txt", {}, "out/missing.txt"),
+                ("a.txt", {"n": 3}, "out/a3.txt"),
+            ]
+        )
+
+        assert [content for content, _ in results] == ["a1", "b2", "", "a3"]
+        assert results[2][1].error.error_type == "TemplateNotFound"
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+            "a1.txt",
+            "a3.txt",
+        ]
+
+    def test_generate_batch_threaded_writes(self, templates_dir: Path, tmp_path: Path):
+        """Test threaded batch writes produce the same files, last job winning."""
+        (templates_dir / "n.txt").write_text("{{ n }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+        jobs = [("n.txt", {"n": n}, f"out/{n % 5}.txt") for n in range(20)]
+
+        templates.generate_batch(jobs, max_workers=4)
+
+        assert {p.name: p.read_text() for p in (tmp_path / "out").iterdir()} == {
+            f"{n}.txt": str(n + 15) for n in range(5)
+        }
+
+    @pytest.mark.parametrize("size", [10, 100_000])
+    def test_output_file_written(self, templates_dir: Path, tmp_path: Path, size: int):
+        """Test small and large outputs are written verbatim as UTF-8."""
+        (templates_dir / "body.txt").write_text("{{ body }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+        body = "é" * size
+
+        content, error = templates.generate_test_documentation(
+            {"body": body}, doc_template="body.txt", output_file="docs/out.txt"
+        )
+
+        assert error is None
+        assert (tmp_path / "docs" / "out.txt").read_text(encoding="utf-8") == body
+
+    def test_api_tests_methods_keep_first_seen_order(self, templates_dir: Path, tmp_path: Path):
+        """Test distinct endpoint methods are listed in first-seen order."""
+        (templates_dir / "methods.txt").write_text("{{ methods | join(',') }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+        endpoints = [{"method": "POST"}, {}, {"method": "POST"}, {"method": "DELETE"}]
+
+        content, _ = templates.generate_api_tests(endpoints, api_test_template="methods.txt")
+
+        assert content == "POST,GET,DELETE"
+
+    def test_output_dir_recreated_after_removal(self, templates_dir: Path, tmp_path: Path):
+        """Test a removed output directory is created again on a later write."""
+        (templates_dir / "body.txt").write_text("{{ body }}")
+        templates = SmartPytestTemplates(
+            str(templates_dir), output_dir=str(tmp_path / "out")
+        )
+        generate = partial(
+            templates.generate_test_documentation,
+            doc_template="body.txt",
+            output_file="docs/out.txt",
+        )
+
+        output = tmp_path / "out" / "docs" / "out.txt"
+
+        for body in ("one", "two", "three"):
+            shutil.rmtree(tmp_path / "out", ignore_errors=True)
+            content, error = generate({"body": body})
+
+            assert error is None
+            assert output.read_text() == body
+
+    def test_output_dir_reassigned(self, templates_dir: Path, tmp_path: Path):
+        """Test reassigning output_dir redirects writes and the output_dir default."""
+        (templates_dir / "where.txt").write_text("{{ output_dir }}")
+        templates = SmartPytestTemplates(
+            str(templates_dir), output_dir=str(tmp_path / "first")
+        )
+        templates.generate_test_documentation(
+            {}, doc_template="where.txt", output_file="where.txt"
+        )
+
+        templates.output_dir = tmp_path / "second"
+        content, error = templates.generate_test_documentation(
+            {}, doc_template="where.txt", output_file="where.txt"
+        )
+
+        assert error is None
+        assert content == str(tmp_path / "second")
+        assert (tmp_path / "second" / "where.txt").read_text() == content
+
+    def test_stream_recreates_removed_output_dir(
+        self, templates_dir: Path, tmp_path: Path
+    ):
+        """Test streamed output is written even after its directory was removed."""
+        (templates_dir / "body.txt").write_text("{{ body }}")
+        templates = SmartPytestTemplates(
+            str(templates_dir), output_dir=str(tmp_path / "out")
+        )
+        output = tmp_path / "out" / "docs" / "out.txt"
+
+        for body in ("one", "two"):
+            shutil.rmtree(tmp_path / "out", ignore_errors=True)
+            templates.generate_test_documentation(
+                {"body": body},
+                doc_template="body.txt",
+                output_file="docs/out.txt",
+                stream=True,
+            )
+
+            assert output.read_text() == body
+
+    def test_unchanged_output_file_not_rewritten(self, templates_dir: Path, tmp_path: Path):
+        """Test regenerating identical content leaves the existing file untouched."""
+        (templates_dir / "body.txt").write_text("{{ body }}")
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+        output = tmp_path / "out.txt"
+
+        templates.generate_test_documentation(
+            {"body": "same"}, doc_template="body.txt", output_file="out.txt"
+        )
+        os.utime(output, ns=(0, 0))
+        templates.generate_test_documentation(
+            {"body": "same"}, doc_template="body.txt", output_file="out.txt"
+        )
+        assert output.stat().st_mtime_ns == 0
+
+        templates.generate_test_documentation(
+            {"body": "new"}, doc_template="body.txt", output_file="out.txt"
+        )
+        assert output.read_text() == "new"
+
+    def test_stream_generator_to_file(self, templates_dir: Path, tmp_path: Path):
+        """Test one-shot iterables can be streamed straight into the output file."""
+        (templates_dir / "cases.txt").write_text(
+            "{% for obj in test_objects %}case_{{ obj }}\n{% endfor %}"
+        )
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        content, error = templates.generate_test_cases(
+            (i for i in range(3)),
+            test_template="cases.txt",
+            output_file="test_cases.py",
+            stream=True,
+        )
+
+        assert (content, error) == ("", None)
+        assert (tmp_path / "test_cases.py").read_text() == "case_0\ncase_1\ncase_2\n"
+
+    def test_missing_template_error_reports_input_size(
+        self, templates_dir: Path, tmp_path: Path
+    ):
+        """Test generator errors describe the input size rather than its contents."""
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        content, error = templates.generate_api_tests(
+            [{"method": "GET"}, {"method": "POST"}], output_file="api.py", stream=True
+        )
+
+        assert content == ""
+        assert error.error.error_type == "TemplateNotFound"
+        assert error.error.context_data == {"endpoint_count": "2"}
+
+    def test_stream_test_report(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test reports can be streamed to disk without returning the content."""
+        templates = SmartPytestTemplates(str(pytest_templates_dir), output_dir=str(tmp_path))
+        results = {"tests": [{"status": "passed"}]}
+
+        content, error = templates.generate_test_report(
+            results, output_file="report.html", stream=True
+        )
+
+        assert (content, error) == ("", None)
+        assert (tmp_path / "report.html").read_text() == (
+            "test_execution: 1/1 passed, 0 failed"
+        )
+
+    def test_stream_failure_leaves_no_partial_file(self, templates_dir: Path, tmp_path: Path):
+        """Test a failing streamed render reports an error and writes nothing."""
+        (templates_dir / "mocks.txt").write_text(
+            "{% for spec in mock_specs %}{{ 1 // spec.n }}{% endfor %}"
+        )
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        content, error = templates.generate_mock_objects(
+            iter([{"n": 1}, {"n": 0}]),
+            mock_template="mocks.txt",
+            output_file="mocks.py",
+            stream=True,
+        )
+
+        assert content == ""
+        assert error.error.error_type == "ZeroDivisionError"
+        assert error.error.context_data == {"spec_count": "unknown"}
+        assert list(tmp_path.glob("mocks.py*")) == []
+
+    def test_in_memory_writer(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test an injected writer receives output instead of the filesystem."""
+        writer = InMemoryWriter()
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir), output_dir=str(tmp_path), writer=writer
+        )
+
+        content, _ = templates.generate_test_report({"tests": []}, output_file="report.html")
+
+        assert writer.files == {tmp_path / "report.html": content}
+        assert not (tmp_path / "report.html").exists()
+
+
+class TestSmartPytestTemplatesRenderCache:
+    """Test memoization of generator render results."""
+
+    def test_identical_input_renders_once(
+        self, pytest_templates_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test repeated calls with identical input reuse the rendered content."""
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir),
+            output_dir=str(tmp_path),
+            batch_timestamp=datetime(2024, 1, 1),
+        )
+        calls = []
+        render_template = templates._render_template
+
+        def counting_render_template(*args, **kwargs):
+            calls.append(args[0])
+            return render_template(*args, **kwargs)
+
+        monkeypatch.setattr(templates, "_render_template", counting_render_template)
+        results = {"tests": [{"status": "passed"}, {"status": "failed"}], "pad": "x" * 600}
+
+        first, _ = templates.generate_test_report(results, template_name="padded.txt")
+        second, _ = templates.generate_test_report(dict(results), template_name="padded.txt")
+        templates.generate_test_report({"tests": [], "pad": ""}, template_name="padded.txt")
+
+        assert first == second == "1/2 passed" + "x" * 600
+        assert len(calls) == 2
+
+        templates.clear_render_cache()
+        templates.generate_test_report(results, template_name="padded.txt")
+        assert len(calls) == 3
+
+    def test_small_outputs_are_not_cached(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test cheap renders with tiny output are not memoized."""
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir),
+            output_dir=str(tmp_path),
+            batch_timestamp=datetime(2024, 1, 1),
+        )
+
+        templates.generate_test_report({"tests": []})
+
+        assert not templates._render_cache
+
+    def test_compiled_templates_reused(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test compiled templates are memoized per instance outside debug mode."""
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir), output_dir=str(tmp_path), warmup=False
+        )
+
+        templates.generate_test_report({"tests": []})
+        compiled = templates._compiled_templates["test_report.html"]
+        templates.generate_test_report({"tests": [{"status": "passed"}]})
+
+        assert templates._compiled_templates == {"test_report.html": compiled}
+
+    def test_missing_template_remembered_until_invalidated(
+        self, templates_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test known-missing templates skip the loader until the cache is invalidated."""
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+        templates.generate_test_matrix({}, matrix_template="late.txt")
+        (templates_dir / "late.txt").write_text("found")
+        monkeypatch.setattr(templates, "render_safe", None)  # Must not be reached
+
+        _, error = templates.generate_test_matrix({}, matrix_template="late.txt")
+        assert error.error.error_type == "TemplateNotFound"
+
+        templates.invalidate_template_cache()
+        content, error = templates.generate_test_matrix({}, matrix_template="late.txt")
+        assert (content, error) == ("found", None)
+
+    def test_error_context_types_follow_each_input(
+        self, templates_dir: Path, tmp_path: Path
+    ):
+        """Test equal inputs with different value types are described separately."""
+        templates = SmartPytestTemplates(str(templates_dir), output_dir=str(tmp_path))
+
+        _, first = templates.generate_test_report(
+            {"tests": [], "x": 1}, template_name="gone.html"
+        )
+        _, second = templates.generate_test_report(
+            {"tests": [], "x": True}, template_name="gone.html"
+        )
+
+        assert first.error.context_data["x"] != second.error.context_data["x"]
+
+    def test_unserializable_input_is_not_cached(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test inputs without a stable value representation bypass the cache."""
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir),
+            output_dir=str(tmp_path),
+            batch_timestamp=datetime(2024, 1, 1),
+        )
+
+        templates.generate_test_report(
+            {"tests": [], "pad": "x" * 600, "owner": object()}, template_name="padded.txt"
+        )
+
+        assert not templates._render_cache
+
+    def test_inputs_rendering_differently_are_not_shared(
+        self, pytest_templates_dir: Path, tmp_path: Path
+    ):
+        """Test dict order and tuple vs list changes re-render instead of hitting."""
+        (pytest_templates_dir / "items.txt").write_text(
+            "{% for k, v in items.items() %}{{ k }}{% endfor %}"
+            "{{ seq.__class__.__name__ }}{{ pad }}"
+        )
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir),
+            output_dir=str(tmp_path),
+            batch_timestamp=datetime(2024, 1, 1),
+        )
+        pad = "x" * 600
+
+        def render(items, seq):
+            content, _ = templates.generate_test_report(
+                {"items": items, "seq": seq, "pad": pad}, template_name="items.txt"
+            )
+            return content[: -len(pad)]
+
+        assert render({"a": 1, "b": 2}, [1]) == "ablist"
+        assert render({"b": 2, "a": 1}, [1]) == "balist"
+        assert render({"a": 1, "b": 2}, (1,)) == "abtuple"
+
+    def test_render_cache_size_limited(
+        self, pytest_templates_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test memoized output is bounded in total size, evicting the oldest."""
+        monkeypatch.setattr(pytest_integration, "_RENDER_CACHE_MAX_CHARS", 8 * 1000)
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir),
+            output_dir=str(tmp_path),
+            batch_timestamp=datetime(2024, 1, 1),
+        )
+
+        for i in range(12):
+            templates.generate_test_report(
+                {"tests": [], "pad": str(i) * 900}, template_name="padded.txt"
+            )
+        templates.generate_test_report(
+            {"tests": [], "pad": "x" * 1200}, template_name="padded.txt"
+        )
+
+        cached = templates._render_cache
+        assert len(cached) == 8
+        assert templates._render_cache_chars == sum(map(len, cached.values()))
+        assert templates._render_cache_chars <= 8 * 1000
+
+    def test_cache_keys_keep_order_and_types(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test inputs that can render differently never share a cache key."""
+        templates = SmartPytestTemplates(str(pytest_templates_dir), output_dir=str(tmp_path))
+        pairs = [
+            ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+            (Path("x"), "x"),
+            (Decimal("1"), "1"),
+            (1, True),
+            (1, 1.0),
+        ]
+
+        for first, second in pairs:
+            assert templates._cache_key("t", first) != templates._cache_key("t", second)
+        assert templates._cache_key("t", {"a": [1]}) == templates._cache_key("t", {"a": [1]})
+
+    def test_debug_mode_skips_cache(self, pytest_templates_dir: Path, tmp_path: Path):
+        """Test renders are not memoized while templates may be edited."""
+        templates = SmartPytestTemplates(
+            str(pytest_templates_dir), output_dir=str(tmp_path), debug_mode=True
+        )
+
+        templates.generate_test_report(
+            {"tests": [], "pad": "x" * 600}, template_name="padded.txt"
+        )
+
+        assert not templates._render_cache
@@ -0,0 +1,371 @@
+"""
+Test cases for SmartTemplates service integration.
+
+This module tests the full-stack service orchestrator:
+- SmartServiceTemplates: Service, test and configuration file generation
+- Construction and reuse of the specialized template engines
+
+Test Categories:
+- Engines: Lazy construction of the FastAPI, pytest and database engines
+- Generation: generate_full_service and generate_api_documentation output
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+from sqlmodel import Field, SQLModel
+
+from smart_templates.services_integration import (
+    ServiceGenerationConfig,
+    SmartServiceTemplates,
+    get_service_templates,
+)
+
+
+class Widget(SQLModel):
+    """Minimal model to generate a service for."""
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str
+    status: str = "active"
+
+
+class Gadget(SQLModel):
+    """Model whose non-nullable fields need sample values."""
+
+    id: int | None = Field(default=None, nullable=False)
+    label: str | None = Field(default=None, nullable=False)
+    enabled: bool | None = Field(default=None, nullable=False)
+    weight: float | None = Field(default=None, nullable=False)
+    tags: list[str] | None = Field(default=None, nullable=False)
+
+
+@pytest.fixture
+def service_templates_dir(templates_dir: Path) -> Path:
+    """Template directory extended with service generation templates."""
+    files = {
+        "api_docs.md.j2": "{% for m in models %}{{ m.class_name }} {% endfor %}",
+        "fastapi/main.py.j2": "app: {{ models | length }} models",
+        "fastapi/crud_routes.py.j2": "routes for {{ model.table_name }}",
+        "fastapi/database.py.j2": "db: {{ config.database_url }}",
+        "tests/conftest.py.j2": "conftest for {{ project_name }}",
+        "tests/test_crud.py.j2": "tests for {{ model.class_name }}",
+        "README.md.j2": "# {{ project_name }}",
+    }
+    for name, source in files.items():
+        path = templates_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+    return templates_dir
+
+
+@pytest.fixture
+def service_templates(
+    service_templates_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> SmartServiceTemplates:
+    """Service templates writing under tmp_path, including sub-engine defaults."""
+    monkeypatch.chdir(tmp_path)
+    return SmartServiceTemplates(
+        str(service_templates_dir), output_dir=str(tmp_path / "services")
+    )
+
+
+ENGINES = ("fastapi_templates", "pytest_templates", "database_templates")
+
+
+class TestSmartServiceTemplatesEngines:
+    """Test construction of the specialized template engines."""
+
+    def test_engines_not_built_at_construction(
+        self, service_templates: SmartServiceTemplates
+    ):
+        """Test specialized engines are only built on first use."""
+        assert not any(name in vars(service_templates) for name in ENGINES)
+
+        engine = service_templates.fastapi_templates
+
+        assert engine is service_templates.fastapi_templates
+        assert "fastapi_templates" in vars(service_templates)
+        assert "pytest_templates" not in vars(service_templates)
+
+    def test_api_documentation_builds_no_engines(
+        self, service_templates: SmartServiceTemplates
+    ):
+        """Test documentation generation leaves the specialized engines unbuilt."""
+        content, error = service_templates.generate_api_documentation([Widget])
+
+        assert error is None
+        assert content == "Widget "
+        assert not any(name in vars(service_templates) for name in ENGINES)
+
+    def test_disabled_components_are_not_built(
+        self, service_templates: SmartServiceTemplates
+    ):
+        """Test components switched off in the config never build their engines."""
+        config = ServiceGenerationConfig(
+            project_name="shop", generate_database=False, generate_tests=False
+        )
+
+        files, error = service_templates.generate_full_service([Widget], config)
+
+        assert error is None
+        assert "app/main.py" in files
+        assert not any(name in vars(service_templates) for name in ENGINES)
+
+    def test_database_engine_built_when_configured(
+        self, service_templates: SmartServiceTemplates, service_templates_dir: Path
+    ):
+        """Test the database engine is built only for services that include SQL."""
+        (service_templates_dir / "create_table_sqlite.sql.j2").write_text(
+            "{% for t in tables %}CREATE TABLE {{ t.table_name }};{% endfor %}"
+        )
+        config = ServiceGenerationConfig(project_name="shop", generate_tests=False)
+
+        files, error = service_templates.generate_full_service([Widget], config)
+
+        assert error is None
+        assert files["database/schema.sql"] == "CREATE TABLE widget;"
+        assert "database_templates" in vars(service_templates)
+        assert "fastapi_templates" not in vars(service_templates)
+
+    def test_engines_share_environment(self, service_templates: SmartServiceTemplates):
+        """Test specialized engines render through the orchestrator's environment."""
+        engines = [getattr(service_templates, name) for name in ENGINES]
+
+        assert all(engine.env is service_templates.env for engine in engines)
+        assert all(engine.registry is service_templates.registry for engine in engines)
+        assert service_templates.env.bytecode_cache is None
+        # The FastAPI engine adds its core templates to the shared loader once
+        paths = service_templates.env.loader.searchpath
+        assert len(paths) == len(set(paths))
+
+    def test_engines_leave_shared_environment_alone(
+        self, service_templates: SmartServiceTemplates, service_templates_dir: Path
+    ):
+        """Test building engines keeps the orchestrator's templates and globals."""
+        (service_templates_dir / "error.html").write_text("service error page")
+        env = service_templates.env
+        globals_before = dict(env.globals)
+        env.auto_reload = False
+
+        for name in ENGINES:
+            getattr(service_templates, name)
+        service_templates.pytest_templates.set_debug_mode(True)
+
+        assert env.get_template("error.html").render() == "service error page"
+        assert env.globals == globals_before
+        assert env.auto_reload is False
+        assert env.loader.searchpath[0] == str(service_templates_dir)
+
+    def test_bytecode_cache_dir(
+        self,
+        service_templates_dir: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test the bytecode cache is opt-in and shared with the engines."""
+        monkeypatch.chdir(tmp_path)
+        cache_dir = tmp_path / "bytecode"
+        service_templates = SmartServiceTemplates(
+            str(service_templates_dir),
+            output_dir=str(tmp_path / "services"),
+            bytecode_cache_dir=str(cache_dir),
+        )
+        service_templates.generate_api_documentation([Widget])
+
+        assert service_templates.pytest_templates.env.bytecode_cache is not None
+        assert any(cache_dir.glob("*.cache"))
+        assert not any((tmp_path / "services").rglob("*.cache"))
+        service_templates.clear_bytecode_cache()
+        assert not any(cache_dir.glob("*.cache"))
+
+    def test_get_service_templates_is_shared(
+        self, service_templates_dir: Path, tmp_path: Path
+    ):
+        """Test the factory returns one instance per distinct configuration."""
+        directory, output_dir = str(service_templates_dir), str(tmp_path / "out")
+
+        shared = get_service_templates(directory, output_dir)
+
+        assert get_service_templates(directory, output_dir) is shared
+        assert get_service_templates(directory, output_dir, debug_mode=True) is not shared
+
+
+class TestSmartServiceTemplatesGeneration:
+    """Test generate_full_service output."""
+
+    def test_output_tree_recreated_between_runs(
+        self, service_templates: SmartServiceTemplates, tmp_path: Path
+    ):
+        """Test a run after the output tree was removed still writes every file."""
+        config = ServiceGenerationConfig(project_name="shop", generate_database=False)
+        project_dir = tmp_path / "services" / "shop"
+
+        first, _ = service_templates.generate_full_service([Widget], config)
+        shutil.rmtree(tmp_path / "services")
+        files, error = service_templates.generate_full_service([Widget], config)
+
+        assert error is None
+        assert files == first
+        for name, content in files.items():
+            assert (project_dir / name).read_text() == content
+
+    def test_model_metadata(self, service_templates: SmartServiceTemplates):
+        """Test model metadata describes fields and is introspected once per class."""
+        (first,) = service_templates._extract_model_metadata([Widget])
+        (second,) = service_templates._extract_model_metadata([Widget])
+
+        assert second is first
+        assert first["primary_key"] == "id"
+        assert [
+            (f["name"], f["primary_key"], f["unique"], f["searchable"], f["filterable"])
+            for f in first["fields"]
+        ] == [
+            ("id", True, False, False, False),
+            ("name", False, False, True, False),
+            ("status", False, False, False, True),
+        ]
+
+    def test_full_service_files(
+        self, service_templates: SmartServiceTemplates, tmp_path: Path
+    ):
+        """Test app, route, test and config files are rendered and written."""
+        config = ServiceGenerationConfig(project_name="shop", generate_database=False)
+
+        files, error = service_templates.generate_full_service([Widget], config)
+
+        assert error is None
+        assert files == {
+            "app/main.py": "app: 1 models",
+            "app/routes/widget.py": "routes for widget",
+            "app/database.py": "db: sqlite:///./app.db",
+            "tests/conftest.py": "conftest for shop",
+            "tests/test_widget.py": "tests for Widget",
+            "README.md": "# shop",
+        }
+        project_dir = tmp_path / "services" / "shop"
+        for name, content in files.items():
+            assert (project_dir / name).read_text() == content
+
+    def test_templates_resolved_once_per_instance(
+        self, service_templates: SmartServiceTemplates, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test repeat generations reuse compiled templates and remembered misses."""
+        config = ServiceGenerationConfig(project_name="shop", generate_database=False)
+        first, _ = service_templates.generate_full_service([Widget], config)
+        monkeypatch.setattr(service_templates.env, "get_template", None)
+
+        second, error = service_templates.generate_full_service([Widget], config)
+
+        assert error is None
+        assert second == first
+
+    def test_sample_instances(self, service_templates: SmartServiceTemplates):
+        """Test sample values follow the field types, leaving unknown types unset."""
+        (gadget,) = service_templates._create_sample_instances([Widget, Gadget])
+
+        assert (gadget.id, gadget.label, gadget.enabled, gadget.weight, gadget.tags) == (
+            1,
+            "Sample label",
+            True,
+            1.0,
+            None,
+        )
+
+    def test_per_model_files_keep_model_order(
+        self, service_templates: SmartServiceTemplates
+    ):
+        """Test per-model files rendered concurrently are listed in model order."""
+        models = [
+            type(f"Model{i}", (SQLModel,), {"__annotations__": {"name": str}})
+            for i in range(8)
+        ]
+        config = ServiceGenerationConfig(
+            project_name="many", generate_database=False, generate_fastapi=False
+        )
+
+        files, error = service_templates.generate_full_service(models, config)
+
+        assert error is None
+        assert [name for name in files if name.startswith("tests/test_")] == [
+            f"tests/test_model{i}.py" for i in range(8)
+        ]
+
+    def test_output_directory_recreated_after_removal(
+        self, service_templates: SmartServiceTemplates, tmp_path: Path
+    ):
+        """Test a removed output directory is recreated by the next write."""
+        target = tmp_path / "out" / "file.txt"
+        assert service_templates._write_output_file("é", target)
+        shutil.rmtree(tmp_path / "out")
+
+        assert service_templates._write_output_file("é", target)
+        assert target.read_text(encoding="utf-8") == "é"
+
+    def test_single_timestamp_per_service(
+        self, service_templates: SmartServiceTemplates, service_templates_dir: Path
+    ):
+        """Test every file of a generated service carries the same timestamp."""
+        for name in ("fastapi/main.py.j2", "tests/test_crud.py.j2", "README.md.j2"):
+            (service_templates_dir / name).write_text("{{ timestamp.isoformat() }}")
+        config = ServiceGenerationConfig(project_name="shop", generate_database=False)
+
+        files, error = service_templates.generate_full_service([Widget], config)
+
+        assert error is None
+        stamps = {files[n] for n in ("app/main.py", "tests/test_widget.py", "README.md")}
+        assert len(stamps) == 1
+
+    def test_fragment_cache_off_by_default(
+        self, service_templates: SmartServiceTemplates, service_templates_dir: Path
+    ):
+        """Test {% cache %} blocks depending on context are not reused by default."""
+        (service_templates_dir / "README.md.j2").write_text(
+            '{% cache "header" %}{{ project_name }}{% endcache %}'
+        )
+        config = ServiceGenerationConfig(
+            project_name="shop", generate_database=False, generate_fastapi=False
+        )
+        other = config.model_copy(update={"project_name": "blog"})
+
+        files, _ = service_templates.generate_full_service([Widget], config)
+        other_files, _ = service_templates.generate_full_service([Widget], other)
+
+        assert files["README.md"] == "shop"
+        assert other_files["README.md"] == "blog"
+
+    def test_fragment_cache_scoped_to_run(
+        self,
+        service_templates_dir: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test opted-in {% cache %} blocks are reused within a run, not across runs."""
+        monkeypatch.chdir(tmp_path)
+        templates = SmartServiceTemplates(
+            str(service_templates_dir),
+            output_dir=str(tmp_path / "services"),
+            fragment_cache=True,
+        )
+        (service_templates_dir / "tests/test_crud.py.j2").write_text(
+            '{% cache "header" %}{{ project_name }}{% endcache %}:'
+            "{{ model.class_name }}"
+        )
+        models = [
+            type(f"Model{i}", (SQLModel,), {"__annotations__": {"name": str}})
+            for i in range(2)
+        ]
+        config = ServiceGenerationConfig(
+            project_name="shop", generate_database=False, generate_fastapi=False
+        )
+        other = config.model_copy(update={"project_name": "blog"})
+
+        files, _ = templates.generate_full_service(models, config)
+        other_files, _ = templates.generate_full_service(models, other)
+
+        assert files["tests/test_model0.py"] == "shop:Model0"
+        assert files["tests/test_model1.py"] == "shop:Model1"
+        assert other_files["tests/test_model1.py"] == "blog:Model1"
@@ -364,6 +364,18 @@ class TestRealWorldApp:
         response = real_app_client.get("/students/1")
         assert response.status_code == 200
 
+    def test_variation_routes_keep_path_parameter_names(self, real_app_client):
+        """Test variation routes document their original path parameters."""
+        paths = real_app_client.app.openapi()["paths"]
+
+        for path, param in (
+            ("/students/{student_id}/active", "student_id"),
+            ("/students/{student_id}/completed", "student_id"),
+            ("/courses/{course_id}/instructor", "course_id"),
+        ):
+            parameters = paths[path]["get"]["parameters"]
+            assert [p["name"] for p in parameters] == [param]
+
     def test_api_prefix_behavior(self, real_app_client):
         """Test /api/ prefix behavior."""
         response = real_app_client.get("/api/schools")
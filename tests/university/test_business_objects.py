@@ -463,6 +463,20 @@ class TestFactoryFunctions:
             assert enrollment.student is not None
             assert enrollment.course is not None
 
+    def test_complete_test_data_ids(self):
+        """Test create_complete_test_data assigns sequential IDs and foreign keys."""
+        schools, courses, students, enrollments = create_complete_test_data()
+
+        for objects in (schools, courses, students, enrollments):
+            assert [obj.id for obj in objects] == list(range(1, len(objects) + 1))
+
+        for course in courses:
+            assert course.school_id == course.school.id
+
+        for enrollment in enrollments:
+            assert enrollment.student_id == enrollment.student.id
+            assert enrollment.course_id == enrollment.course.id
+
     def test_data_consistency(self):
         """Test that factory functions create consistent, related data."""
         schools, courses, students, enrollments = create_complete_test_data()